@@ -21,13 +21,57 @@ from .models import (
     PipelineInput,
     Table821Row,
 )
-from .rule_tables import lookup_table_821
+from .rule_tables import lookup_table_821_cached
 
 logger = logging.getLogger(__name__)
 
+_MEASURE_IDS: Tuple[int, ...] = (1, 2, 3, 4, 5)
+
+# Yields tried, in order, when Table 8.2.1 has no row for y_control.
+_YIELD_FALLBACKS: Tuple[int, ...] = (355, 390, 460)
+
+# Case-insensitive "EH" grade prefix, matched without upper-casing the grade.
+_EH_GRADE_PREFIXES = frozenset({"EH", "Eh", "eH", "eh"})
+
+# Table 8.2.1 "3+4" cell → (Measure 3, Measure 4).  Other cell states leave
+# both measures at their default.
+_M34_EXPANSION: Dict[MeasureStatus, Tuple[MeasureStatus, MeasureStatus]] = {
+    MeasureStatus.required: (MeasureStatus.required, MeasureStatus.required),
+    MeasureStatus.not_required: (MeasureStatus.not_required, MeasureStatus.not_required),
+}
+
+# Note 2 outcome for Measure 2, keyed on "Measure 3 achieved via enhanced NDE".
+_NOTE_2_STATUS: Dict[bool, MeasureStatus] = {
+    True: MeasureStatus.conditional,
+    False: MeasureStatus.not_required,
+}
+
 
 def _is_specified_number(val: Any) -> bool:
-    return isinstance(val, (int, float)) and val != UNSPECIFIED
+    # UNSPECIFIED is a str, so the numeric check already excludes it.  Float
+    # subclasses (e.g. numpy.float64 assigned after validation) count;
+    # bools do not.
+    return isinstance(val, (int, float)) and not isinstance(val, bool)
+
+
+def _as_int(val: Union[int, float]) -> int:
+    return val if type(val) is int else int(val)
+
+
+def _as_float(val: Union[int, float]) -> float:
+    return val if type(val) is float else float(val)
+
+
+def _float_or_none(val: Any) -> Optional[float]:
+    return _as_float(val) if _is_specified_number(val) else None
+
+
+def _int_or_none(val: Any) -> Optional[int]:
+    return _as_int(val) if _is_specified_number(val) else None
+
+
+def _or_unspecified(val: Optional[Union[int, float]]) -> Union[int, float, str]:
+    return UNSPECIFIED if val is None else val
 
 
 def derive_control_parameters(
@@ -35,74 +79,91 @@ def derive_control_parameters(
 ) -> Tuple[ControlParameters, List[ManualReviewFlag]]:
     """Derive t_control and y_control from side/top plate members."""
     flags: List[ManualReviewFlag] = []
-    cp = ControlParameters()
 
-    side_members = [m for m in members if m.member_role == MemberRole.hatch_coaming_side_plate]
-    top_members = [m for m in members if m.member_role == MemberRole.hatch_coaming_top_plate]
+    # Single pass: only the first side/top member drives the control values,
+    # but every id is kept for the related_ids of any flag raised below.
+    first_side: Optional[MemberInput] = None
+    first_top: Optional[MemberInput] = None
+    side_ids: List[str] = []
+    top_ids: List[str] = []
+    for m in members:
+        if m.member_role is MemberRole.hatch_coaming_side_plate:
+            if first_side is None:
+                first_side = m
+            side_ids.append(m.member_id)
+        elif m.member_role is MemberRole.hatch_coaming_top_plate:
+            if first_top is None:
+                first_top = m
+            top_ids.append(m.member_id)
+
+    # Work on typed Optional locals (None = 미지정); the UNSPECIFIED sentinel
+    # is only written back at the ControlParameters boundary.
+    t_side = _float_or_none(first_side.thickness_mm_as_built) if first_side else None
+    t_top = _float_or_none(first_top.thickness_mm_as_built) if first_top else None
+    y_side = _int_or_none(first_side.yield_strength_nmm2) if first_side else None
+    y_top = _int_or_none(first_top.yield_strength_nmm2) if first_top else None
 
     # Thickness
-    if side_members and _is_specified_number(side_members[0].thickness_mm_as_built):
-        cp.t_side = float(side_members[0].thickness_mm_as_built)
-    if top_members and _is_specified_number(top_members[0].thickness_mm_as_built):
-        cp.t_top = float(top_members[0].thickness_mm_as_built)
-
-    if _is_specified_number(cp.t_side) and _is_specified_number(cp.t_top):
-        cp.t_control = max(cp.t_side, cp.t_top)
-    elif _is_specified_number(cp.t_side):
-        cp.t_control = cp.t_side
+    t_control: Optional[float] = None
+    if t_side is not None and t_top is not None:
+        t_control = max(t_side, t_top)
+    elif t_side is not None:
+        t_control = t_side
         flags.append(ManualReviewFlag(
             flag_id="t_control_partial",
             category="control_parameter",
             message="t_top is 미지정; t_control derived from t_side only.",
-            related_ids=[m.member_id for m in side_members],
+            related_ids=side_ids,
         ))
-    elif _is_specified_number(cp.t_top):
-        cp.t_control = cp.t_top
+    elif t_top is not None:
+        t_control = t_top
         flags.append(ManualReviewFlag(
             flag_id="t_control_partial",
             category="control_parameter",
             message="t_side is 미지정; t_control derived from t_top only.",
-            related_ids=[m.member_id for m in top_members],
+            related_ids=top_ids,
         ))
     # else: both 미지정 → t_control stays 미지정
 
     # Yield strength
-    if side_members and _is_specified_number(side_members[0].yield_strength_nmm2):
-        cp.y_side = int(side_members[0].yield_strength_nmm2)
-    if top_members and _is_specified_number(top_members[0].yield_strength_nmm2):
-        cp.y_top = int(top_members[0].yield_strength_nmm2)
-
-    if _is_specified_number(cp.y_side) and _is_specified_number(cp.y_top):
-        cp.y_control = max(cp.y_side, cp.y_top)
-        if cp.y_side != cp.y_top:
+    y_control: Optional[int] = None
+    if y_side is not None and y_top is not None:
+        y_control = max(y_side, y_top)
+        if y_side != y_top:
             flags.append(ManualReviewFlag(
                 flag_id="yield_mismatch",
                 category="control_parameter",
                 message=(
-                    f"Side yield ({cp.y_side}) != top yield ({cp.y_top}). "
-                    f"Using max ({cp.y_control}) but manual review recommended."
+                    f"Side yield ({y_side}) != top yield ({y_top}). "
+                    f"Using max ({y_control}) but manual review recommended."
                 ),
-                related_ids=[
-                    m.member_id for m in side_members + top_members
-                ],
+                related_ids=side_ids + top_ids,
             ))
-    elif _is_specified_number(cp.y_side):
-        cp.y_control = cp.y_side
+    elif y_side is not None:
+        y_control = y_side
         flags.append(ManualReviewFlag(
             flag_id="y_control_partial",
             category="control_parameter",
             message="y_top is 미지정; y_control derived from y_side only.",
-            related_ids=[m.member_id for m in side_members],
+            related_ids=side_ids,
         ))
-    elif _is_specified_number(cp.y_top):
-        cp.y_control = cp.y_top
+    elif y_top is not None:
+        y_control = y_top
         flags.append(ManualReviewFlag(
             flag_id="y_control_partial",
             category="control_parameter",
             message="y_side is 미지정; y_control derived from y_top only.",
-            related_ids=[m.member_id for m in top_members],
+            related_ids=top_ids,
         ))
 
+    cp = ControlParameters(
+        t_side=_or_unspecified(t_side),
+        t_top=_or_unspecified(t_top),
+        t_control=_or_unspecified(t_control),
+        y_side=_or_unspecified(y_side),
+        y_top=_or_unspecified(y_top),
+        y_control=_or_unspecified(y_control),
+    )
     return cp, flags
 
 
@@ -111,22 +172,22 @@ def determine_required_measures(
     y_control: Union[int, str],
     t_control: Union[float, str],
     measure3_choice: Measure3Choice,
+    capture_lookup_info: bool = True,
 ) -> Tuple[Dict[int, MeasureStatus], Dict[str, Any], List[ManualReviewFlag]]:
     """Determine which measures are required based on Table 8.2.1 lookup.
 
+    With ``capture_lookup_info=False`` the returned lookup_info stays empty,
+    for callers that only need the measure statuses.
+
     Returns:
         required_measures: dict {measure_id: status}
         lookup_info: metadata about the lookup
         flags: any manual review flags
     """
     flags: List[ManualReviewFlag] = []
-    required: Dict[int, MeasureStatus] = {
-        1: MeasureStatus.not_required,
-        2: MeasureStatus.not_required,
-        3: MeasureStatus.not_required,
-        4: MeasureStatus.not_required,
-        5: MeasureStatus.not_required,
-    }
+    required: Dict[int, MeasureStatus] = dict.fromkeys(
+        _MEASURE_IDS, MeasureStatus.not_required,
+    )
     lookup_info: Dict[str, Any] = {}
 
     if not _is_specified_number(y_control) or not _is_specified_number(t_control):
@@ -141,8 +202,9 @@ def determine_required_measures(
         ))
         return required, lookup_info, flags
 
-    y = int(y_control)
-    t = float(t_control)
+    y = _as_int(y_control)
+    t = _as_float(t_control)
+    logger.debug("Table 8.2.1 lookup: y_control=%s, t_control=%s", y, t)
 
     # Thickness > 100 special consideration
     if t > 100:
@@ -155,17 +217,17 @@ def determine_required_measures(
                 "All measures assumed Required pending manual review."
             ),
         ))
-        for m in required:
-            required[m] = MeasureStatus.required
-        lookup_info["special"] = "thickness > 100mm → all measures Required"
+        required = dict.fromkeys(_MEASURE_IDS, MeasureStatus.required)
+        if capture_lookup_info:
+            lookup_info["special"] = "thickness > 100mm → all measures Required"
         return required, lookup_info, flags
 
     # Standard lookup
-    row = lookup_table_821(table_821, y, t)
+    row = lookup_table_821_cached(table_821, y, t)
     if row is None:
         # Try nearest yield
-        for try_yield in [355, 390, 460]:
-            row = lookup_table_821(table_821, try_yield, t)
+        for try_yield in _YIELD_FALLBACKS:
+            row = lookup_table_821_cached(table_821, try_yield, t)
             if row:
                 flags.append(ManualReviewFlag(
                     flag_id="yield_fallback",
@@ -185,25 +247,23 @@ def determine_required_measures(
         ))
         return required, lookup_info, flags
 
-    lookup_info["matched_row"] = {
-        "yield": row.yield_strength_nmm2,
-        "range": row.thickness_range_mm,
-        "m1": row.measure_1.status.value,
-        "m2": row.measure_2.status.value,
-        "m3_4": row.measure_3_and_4.status.value,
-        "m5": row.measure_5.status.value,
-    }
+    if capture_lookup_info:
+        lookup_info["matched_row"] = {
+            "yield": row.yield_strength_nmm2,
+            "range": row.thickness_range_mm,
+            "m1": row.measure_1.status.value,
+            "m2": row.measure_2.status.value,
+            "m3_4": row.measure_3_and_4.status.value,
+            "m5": row.measure_5.status.value,
+        }
 
     # Measure 1
     required[1] = row.measure_1.status
 
     # Measure 3+4 expansion: if Required → both 3 and 4 are Required
-    if row.measure_3_and_4.status == MeasureStatus.required:
-        required[3] = MeasureStatus.required
-        required[4] = MeasureStatus.required
-    elif row.measure_3_and_4.status == MeasureStatus.not_required:
-        required[3] = MeasureStatus.not_required
-        required[4] = MeasureStatus.not_required
+    required[3], required[4] = _M34_EXPANSION.get(
+        row.measure_3_and_4.status, (required[3], required[4]),
+    )
 
     # Measure 5
     required[5] = row.measure_5.status
@@ -211,16 +271,15 @@ def determine_required_measures(
     # Measure 2: Note 2 handling
     if row.measure_2.status == MeasureStatus.see_note_2:
         # Note 2: Measure 2 is conditional — only if Measure 3 is achieved via enhanced_NDE
-        if measure3_choice.option == Measure3Option.enhanced_NDE:
-            required[2] = MeasureStatus.conditional
-            lookup_info["note_2_applied"] = True
-        else:
-            required[2] = MeasureStatus.not_required
-            lookup_info["note_2_applied"] = False
-            lookup_info["note_2_reason"] = (
-                f"Measure 3 option is '{measure3_choice.option.value}', "
-                "not 'enhanced_NDE'. Measure 2 not applicable per Note 2."
-            )
+        via_enhanced_nde = measure3_choice.option == Measure3Option.enhanced_NDE
+        required[2] = _NOTE_2_STATUS[via_enhanced_nde]
+        if capture_lookup_info:
+            lookup_info["note_2_applied"] = via_enhanced_nde
+            if not via_enhanced_nde:
+                lookup_info["note_2_reason"] = (
+                    f"Measure 3 option is '{measure3_choice.option.value}', "
+                    "not 'enhanced_NDE'. Measure 2 not applicable per Note 2."
+                )
     else:
         required[2] = row.measure_2.status
 
@@ -230,6 +289,7 @@ def determine_required_measures(
 def run_decision(
     pipeline_input: PipelineInput,
     table_821: List[Table821Row],
+    capture_lookup_info: bool = True,
 ) -> Tuple[
     ControlParameters,
     Dict[int, MeasureStatus],
@@ -244,17 +304,19 @@ def run_decision(
         y_control=cp.y_control,
         t_control=cp.t_control,
         measure3_choice=pipeline_input.measure3_choice,
+        capture_lookup_info=capture_lookup_info,
     )
 
     all_flags = cp_flags + decision_flags
 
     # Additional grade validation
     for m in pipeline_input.members:
+        y = m.yield_strength_nmm2
         if (
-            _is_specified_number(m.yield_strength_nmm2)
-            and int(m.yield_strength_nmm2) == 460
+            _is_specified_number(y)
+            and y == 460
             and m.grade != UNSPECIFIED
-            and not m.grade.upper().startswith("EH")
+            and m.grade[:2] not in _EH_GRADE_PREFIXES
         ):
             all_flags.append(ManualReviewFlag(
                 flag_id=f"grade_check_{m.member_id}",
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .models import (
     DecisionResult,
@@ -17,6 +17,49 @@ from .models import (
 )
 
 
+_HAS_ORJSON = False
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    pass
+
+
+# Characters in a doc label that are unsafe in a snippet file name.
+_SAFE_LABEL_TABLE = str.maketrans({"/": "_", "\\": "_", ":": "_", " ": "_"})
+
+
+def _ensure_dir(path: str) -> None:
+    """Create *path* if missing; existing directories cost a single stat."""
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+
+def _write_json(
+    path: str,
+    obj: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+    ensure_ascii: bool = False,
+) -> None:
+    """Write *obj* as 2-space-indented UTF-8 JSON, via orjson when available.
+
+    *default* converts otherwise unserialisable values, as in ``json.dumps``.
+    The structure is the same either way, but float spelling depends on
+    whether orjson is installed: orjson writes ``1e-7`` / ``1e16`` where the
+    stdlib writes ``1e-07`` / ``1e+16``.  orjson cannot escape non-ASCII, so
+    ``ensure_ascii=True`` always uses the stdlib encoder.
+    """
+    if _HAS_ORJSON and not ensure_ascii:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, default=default, option=option))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=ensure_ascii, default=default)
+
+
 def write_evidence(
     output_dir: str,
     rules_extraction: RulesExtraction,
@@ -25,13 +68,13 @@ def write_evidence(
     """Write evidence files to output_dir/evidence/."""
     evidence_dir = os.path.join(output_dir, "evidence")
     snippets_dir = os.path.join(evidence_dir, "ocr_snippets")
-    os.makedirs(snippets_dir, exist_ok=True)
+    _ensure_dir(snippets_dir)
 
     paths: Dict[str, str] = {}
 
     # Write OCR source snippets as individual text files
     for label, snippet_text in rules_extraction.source_snippets.items():
-        safe_label = label.replace("/", "_").replace(" ", "_")
+        safe_label = label.translate(_SAFE_LABEL_TABLE)
         snippet_path = os.path.join(snippets_dir, f"{safe_label}.txt")
         with open(snippet_path, "w", encoding="utf-8") as f:
             f.write(snippet_text)
@@ -40,22 +83,19 @@ def write_evidence(
     # Write textual requirements as separate evidence
     if rules_extraction.textual_requirements:
         reqs_path = os.path.join(evidence_dir, "textual_requirements.json")
-        with open(reqs_path, "w", encoding="utf-8") as f:
-            json.dump(rules_extraction.textual_requirements, f, indent=2, ensure_ascii=False)
+        _write_json(reqs_path, rules_extraction.textual_requirements)
         paths["textual_requirements"] = reqs_path
 
     # Write OCR confidence report
     if rules_extraction.ocr_confidence:
         conf_path = os.path.join(evidence_dir, "ocr_confidence.json")
-        with open(conf_path, "w", encoding="utf-8") as f:
-            json.dump(rules_extraction.ocr_confidence, f, indent=2)
+        _write_json(conf_path, rules_extraction.ocr_confidence, ensure_ascii=True)
         paths["ocr_confidence"] = conf_path
 
     # Write extraction warnings
     if rules_extraction.extraction_warnings:
         warn_path = os.path.join(evidence_dir, "extraction_warnings.json")
-        with open(warn_path, "w", encoding="utf-8") as f:
-            json.dump(rules_extraction.extraction_warnings, f, indent=2, ensure_ascii=False)
+        _write_json(warn_path, rules_extraction.extraction_warnings)
         paths["extraction_warnings"] = warn_path
 
     return paths
@@ -67,7 +107,7 @@ def write_audit_json(
     decision_result: DecisionResult,
 ) -> Dict[str, str]:
     """Write the main audit JSON files."""
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     paths: Dict[str, str] = {}
 
     # rules_extraction.json
@@ -83,3 +123,11 @@ def write_audit_json(
     paths["decision_results"] = decision_path
 
     return paths
+
+
+def write_summary_json(output_dir: str, summary: Dict[str, Any]) -> str:
+    """Write ``pipeline_summary.json``; non-JSON values are written as ``str``."""
+    _ensure_dir(output_dir)
+    summary_path = os.path.join(output_dir, "pipeline_summary.json")
+    _write_json(summary_path, summary, default=str)
+    return summary_path
@@ -2,6 +2,10 @@
 
 Applies Measures 1–5 to specific targets (members or joints).
 All applications are append-only — new measures never remove existing ones.
+
+Applications and flags are built with ``model_construct``: every field is
+assembled here from already-validated inputs, so pydantic validation is
+skipped on these hot paths on purpose.
 """
 
 from __future__ import annotations
@@ -25,21 +29,92 @@ from .models import (
     WeldProcess,
     Zone,
 )
-from .rule_tables import lookup_table_822
+from .rule_tables import lookup_table_822_cached
 
 logger = logging.getLogger(__name__)
 
 # Roles considered "upper flange" for Measure 1 applicability
-_UPPER_FLANGE_ROLES = {
+_UPPER_FLANGE_ROLES = frozenset({
     MemberRole.upper_deck_plate,
     MemberRole.hatch_coaming_side_plate,
     MemberRole.hatch_coaming_top_plate,
     MemberRole.attached_longitudinal,
-}
+})
+
+# Joint roles that bring a butt joint under the Measure 3 sub-options
+_COAMING_OR_DECK_ROLES = frozenset({
+    MemberRole.hatch_coaming_side_plate,
+    MemberRole.upper_deck_plate,
+})
+_COAMING_DECK_LONG_ROLES = _COAMING_OR_DECK_ROLES | {MemberRole.attached_longitudinal}
+
+# One bit per role, so a joint's connected roles fold into a single int
+_ROLE_BIT = {role: 1 << i for i, role in enumerate(MemberRole)}
+
+
+def _role_mask(roles: frozenset) -> int:
+    mask = 0
+    for role in roles:
+        mask |= _ROLE_BIT[role]
+    return mask
+
+
+_COAMING_OR_DECK_MASK = _role_mask(_COAMING_OR_DECK_ROLES)
+_COAMING_DECK_OR_LONG_MASK = _role_mask(_COAMING_DECK_LONG_ROLES)
+
+# Measure 1 / Measure 2 application text
+_M1_NAME = "100% UT during construction"
+_M1_DESC = (
+    "100% ultrasonic testing of upper flange "
+    "longitudinal members block-to-block butt joints "
+    "during construction."
+)
+_M1_RULE = "Table 8.2.1 Measure 1"
+_M2_NAME = "Enhanced NDE conditional (Note 2)"
+_M2_DESC = (
+    "Conditional measure per Note 2: applicable "
+    "because Measure 3 is achieved via enhanced NDE."
+)
+_M2_RULE = "Table 8.2.1 Note 2"
+
+# Descriptions for the remaining measure applications
+_M3_BCA_DESC = (
+    "Hatch coaming side plate requires BCA "
+    "(Brittle Crack Arrest) steel when Measure 3 is required."
+)
+_M4_DESC = (
+    "Upper deck plate requires BCA (Brittle Crack Arrest) "
+    "steel per Table 8.2.2."
+)
+_M5_DESC = (
+    "Upper deck plate – additional BCA requirement "
+    "tracked as Measure 5 for traceability."
+)
+_PJP_DESC = (
+    "Coaming-to-deck connection requires LR-approved "
+    "partial joint penetration (PJP) weld."
+)
+_BLOCK_SHIFT_DESC = (
+    "Block shift: coaming side butt weld vs upper deck butt weld "
+    "offset must be ≥ 300mm."
+)
+_CRACK_ARREST_HOLE_DESC = (
+    "Crack arrest hole at corner/intersection. "
+    "Fatigue strength special assessment required."
+)
+_CRACK_ARREST_INSERT_DESC = (
+    "High crack-arrest performance insert plate or "
+    "weld metal insert required."
+)
+_ENHANCED_NDE_DESC = (
+    "ShipRight-based stricter acceptance criteria. "
+    "CTOD ≥ 0.18mm required. EGW prohibited."
+)
 
 
 def _is_num(val: Any) -> bool:
-    return isinstance(val, (int, float))
+    # Same rule as decision_engine._is_specified_number
+    return isinstance(val, (int, float)) and not isinstance(val, bool)
 
 
 def apply_measures(
@@ -60,166 +135,146 @@ def apply_measures(
     flags: List[ManualReviewFlag] = []
     pending: List[Dict[str, Any]] = []
 
-    member_map = {m.member_id: m for m in members}
-
-    # ── Measure 1 (target=joint) ────────────────────────────────────────
-    if required_measures.get(1) == MeasureStatus.required:
-        for j in joints:
-            if (
-                j.zone == Zone.cargo_hold_region
-                and j.joint_type == JointType.block_to_block_butt
-            ):
-                # Check if connected members are upper flange
-                connected_upper = all(
-                    member_map.get(mid, MemberInput(
-                        member_id="?", member_role=MemberRole.unknown
-                    )).member_role in _UPPER_FLANGE_ROLES
-                    for mid in j.connected_members
-                )
-                if connected_upper:
-                    applications.append(MeasureApplication(
-                        measure_id=1,
-                        measure_name="100% UT during construction",
-                        status=MeasureStatus.required,
-                        target_type=MeasureTarget.joint,
-                        target_id=j.joint_id,
-                        details={
-                            "description": (
-                                "100% ultrasonic testing of upper flange "
-                                "longitudinal members block-to-block butt joints "
-                                "during construction."
-                            ),
-                            "connected_members": j.connected_members,
-                        },
-                        rule_ref="Table 8.2.1 Measure 1",
-                    ))
-
-    # ── Measure 2 (target=joint, conditional) ───────────────────────────
-    if required_measures.get(2) in (MeasureStatus.required, MeasureStatus.conditional):
-        # Measure 2 applies only when Measure 3 is via enhanced NDE
-        if measure3_choice.option == Measure3Option.enhanced_NDE:
-            for j in joints:
-                if (
-                    j.zone == Zone.cargo_hold_region
-                    and j.joint_type == JointType.block_to_block_butt
-                ):
-                    connected_upper = all(
-                        member_map.get(mid, MemberInput(
-                            member_id="?", member_role=MemberRole.unknown
-                        )).member_role in _UPPER_FLANGE_ROLES
-                        for mid in j.connected_members
-                    )
-                    if connected_upper:
-                        applications.append(MeasureApplication(
-                            measure_id=2,
-                            measure_name="Enhanced NDE conditional (Note 2)",
-                            status=MeasureStatus.conditional,
-                            target_type=MeasureTarget.joint,
-                            target_id=j.joint_id,
-                            details={
-                                "description": (
-                                    "Conditional measure per Note 2: applicable "
-                                    "because Measure 3 is achieved via enhanced NDE."
-                                ),
-                                "nde_method": measure3_choice.parameters.enhanced_nde_method.value,
-                            },
-                            rule_ref="Table 8.2.1 Note 2",
-                        ))
+    # Partition joints once; each measure below walks only its own subset.
+    b2b_joints = [
+        j for j in joints if j.joint_type == JointType.block_to_block_butt
+    ]
+    b2b_cargo_joints = [j for j in b2b_joints if j.zone == Zone.cargo_hold_region]
+    coaming_deck_joints = [
+        j for j in joints if j.joint_type == JointType.coaming_to_deck_connection
+    ]
+
+    # ── Measures 1 and 2 (target=joint) ───────────────────────────────
+    need1 = required_measures.get(1) == MeasureStatus.required
+    # Measure 2 (conditional) applies only when Measure 3 is via enhanced NDE
+    need2 = (
+        measure3_choice.option == Measure3Option.enhanced_NDE
+        and required_measures.get(2) in (MeasureStatus.required, MeasureStatus.conditional)
+    )
+    if need1 or need2:
+        # Last member wins on a duplicated member_id, as in _apply_measure_3.
+        roles = {m.member_id: m.member_role for m in members}
+        upper_member_ids = {
+            mid for mid, r in roles.items() if r in _UPPER_FLANGE_ROLES
+        }
+        nde_method = measure3_choice.parameters.enhanced_nde_method.value
+        m2_apps: List[MeasureApplication] = []
+        for j in b2b_cargo_joints:
+            # Check if connected members are upper flange
+            if not upper_member_ids.issuperset(j.connected_members):
+                continue
+            if need1:
+                applications.append(MeasureApplication.model_construct(
+                    measure_id=1,
+                    measure_name=_M1_NAME,
+                    status=MeasureStatus.required,
+                    target_type=MeasureTarget.joint,
+                    target_id=j.joint_id,
+                    details={
+                        "description": _M1_DESC,
+                        "connected_members": j.connected_members,
+                    },
+                    rule_ref=_M1_RULE,
+                ))
+            if need2:
+                m2_apps.append(MeasureApplication.model_construct(
+                    measure_id=2,
+                    measure_name=_M2_NAME,
+                    status=MeasureStatus.conditional,
+                    target_type=MeasureTarget.joint,
+                    target_id=j.joint_id,
+                    details={
+                        "description": _M2_DESC,
+                        "nde_method": nde_method,
+                    },
+                    rule_ref=_M2_RULE,
+                ))
+        # All Measure 1 applications precede Measure 2, as before.
+        applications.extend(m2_apps)
 
     # ── Measure 3 (target=member + joint) ───────────────────────────────
     if required_measures.get(3) == MeasureStatus.required:
         _apply_measure_3(
-            measure3_choice, members, joints, member_map,
+            measure3_choice, members, b2b_joints,
             table_822, applications, flags, pending,
         )
 
-    # ── Measure 4 (target=member): BCA steel for upper deck ─────────────
-    if required_measures.get(4) == MeasureStatus.required:
+    # ── Measures 4 and 5 (target=member): BCA steel for upper deck ─────
+    need4 = required_measures.get(4) == MeasureStatus.required
+    need5 = required_measures.get(5) == MeasureStatus.required
+    if need4 or need5:
+        m4_apps: List[MeasureApplication] = []
+        m5_apps: List[MeasureApplication] = []
         for m in members:
-            if m.member_role == MemberRole.upper_deck_plate:
-                bca_entry = None
-                if _is_num(m.yield_strength_nmm2) and _is_num(m.thickness_mm_as_built):
-                    bca_entry = lookup_table_822(
-                        table_822, "upper_deck",
-                        int(m.yield_strength_nmm2),
-                        float(m.thickness_mm_as_built),
-                    )
-                bca_type = bca_entry.bca_type if bca_entry else UNSPECIFIED
-                applications.append(MeasureApplication(
+            if m.member_role != MemberRole.upper_deck_plate:
+                continue
+            bca_entry = None
+            if _is_num(m.yield_strength_nmm2) and _is_num(m.thickness_mm_as_built):
+                bca_entry = lookup_table_822_cached(
+                    table_822, "upper_deck",
+                    int(m.yield_strength_nmm2),
+                    float(m.thickness_mm_as_built),
+                )
+            bca_type = bca_entry.bca_type if bca_entry else UNSPECIFIED
+            if need4:
+                m4_apps.append(MeasureApplication.model_construct(
                     measure_id=4,
                     measure_name="BCA steel for upper deck plate",
                     status=MeasureStatus.required,
                     target_type=MeasureTarget.member,
                     target_id=m.member_id,
                     details={
-                        "description": (
-                            "Upper deck plate requires BCA (Brittle Crack Arrest) "
-                            "steel per Table 8.2.2."
-                        ),
+                        "description": _M4_DESC,
                         "bca_type": bca_type,
                         "yield": m.yield_strength_nmm2,
                         "thickness": m.thickness_mm_as_built,
                     },
                     rule_ref="Table 8.2.1 Measure 4 + Table 8.2.2",
                 ))
-
-    # ── Measure 5 (target=member): same as 4 but separate ID ───────────
-    if required_measures.get(5) == MeasureStatus.required:
-        for m in members:
-            if m.member_role == MemberRole.upper_deck_plate:
-                bca_entry = None
-                if _is_num(m.yield_strength_nmm2) and _is_num(m.thickness_mm_as_built):
-                    bca_entry = lookup_table_822(
-                        table_822, "upper_deck",
-                        int(m.yield_strength_nmm2),
-                        float(m.thickness_mm_as_built),
-                    )
-                bca_type = bca_entry.bca_type if bca_entry else UNSPECIFIED
-                applications.append(MeasureApplication(
+            # Measure 5: same as 4 but separate ID
+            if need5:
+                m5_apps.append(MeasureApplication.model_construct(
                     measure_id=5,
                     measure_name="BCA steel for upper deck plate (Measure 5)",
                     status=MeasureStatus.required,
                     target_type=MeasureTarget.member,
                     target_id=m.member_id,
                     details={
-                        "description": (
-                            "Upper deck plate – additional BCA requirement "
-                            "tracked as Measure 5 for traceability."
-                        ),
+                        "description": _M5_DESC,
                         "bca_type": bca_type,
                         "yield": m.yield_strength_nmm2,
                         "thickness": m.thickness_mm_as_built,
                     },
                     rule_ref="Table 8.2.1 Measure 5 + Table 8.2.2",
                 ))
+        # Keep all Measure 4 applications ahead of Measure 5, as before.
+        applications.extend(m4_apps)
+        applications.extend(m5_apps)
 
     # ── PJP requirement (target=joint) ──────────────────────────────────
-    for j in joints:
-        if j.joint_type == JointType.coaming_to_deck_connection:
-            applications.append(MeasureApplication(
-                measure_id=0,  # 0 = structural requirement, not numbered measure
-                measure_name="LR-approved PJP weld required",
-                status=MeasureStatus.required,
-                target_type=MeasureTarget.joint,
-                target_id=j.joint_id,
-                details={
-                    "description": (
-                        "Coaming-to-deck connection requires LR-approved "
-                        "partial joint penetration (PJP) weld."
-                    ),
-                },
-                rule_ref="Sec 8 – coaming side to upper deck connection",
-            ))
+    for j in coaming_deck_joints:
+        applications.append(MeasureApplication.model_construct(
+            measure_id=0,  # 0 = structural requirement, not numbered measure
+            measure_name="LR-approved PJP weld required",
+            status=MeasureStatus.required,
+            target_type=MeasureTarget.joint,
+            target_id=j.joint_id,
+            details={
+                "description": _PJP_DESC,
+            },
+            rule_ref="Sec 8 – coaming side to upper deck connection",
+        ))
 
     # ── thickness > 100mm flag ──────────────────────────────────────────
     for m in members:
-        if _is_num(m.thickness_mm_as_built) and float(m.thickness_mm_as_built) > 100:
-            flags.append(ManualReviewFlag(
+        t = m.thickness_mm_as_built
+        if _is_num(t) and t > 100:
+            flags.append(ManualReviewFlag.model_construct(
                 flag_id=f"thick_gt100_{m.member_id}",
                 category="special_consideration",
                 message=(
                     f"Member {m.member_id} thickness "
-                    f"{m.thickness_mm_as_built}mm > 100mm. "
+                    f"{t}mm > 100mm. "
                     "Special consideration required."
                 ),
                 related_ids=[m.member_id],
@@ -231,37 +286,36 @@ def apply_measures(
 def _apply_measure_3(
     measure3_choice: Measure3Choice,
     members: List[MemberInput],
-    joints: List[JointInput],
-    member_map: Dict[str, MemberInput],
+    b2b_joints: List[JointInput],
     table_822: List[Table822Entry],
     applications: List[MeasureApplication],
     flags: List[ManualReviewFlag],
     pending: List[Dict[str, Any]],
 ) -> None:
-    """Apply Measure 3 sub-options to appropriate targets."""
+    """Apply Measure 3 sub-options to appropriate targets.
+
+    ``b2b_joints`` holds only the block-to-block butt joints.
+    """
 
     # (a) BCA steel for hatch coaming side plate (always when Measure 3 required)
     for m in members:
         if m.member_role == MemberRole.hatch_coaming_side_plate:
             bca_entry = None
             if _is_num(m.yield_strength_nmm2) and _is_num(m.thickness_mm_as_built):
-                bca_entry = lookup_table_822(
+                bca_entry = lookup_table_822_cached(
                     table_822, "hatch_coaming_side",
                     int(m.yield_strength_nmm2),
                     float(m.thickness_mm_as_built),
                 )
             bca_type = bca_entry.bca_type if bca_entry else UNSPECIFIED
-            applications.append(MeasureApplication(
+            applications.append(MeasureApplication.model_construct(
                 measure_id=3,
                 measure_name="BCA steel for hatch coaming side plate",
                 status=MeasureStatus.required,
                 target_type=MeasureTarget.member,
                 target_id=m.member_id,
                 details={
-                    "description": (
-                        "Hatch coaming side plate requires BCA "
-                        "(Brittle Crack Arrest) steel when Measure 3 is required."
-                    ),
+                    "description": _M3_BCA_DESC,
                     "bca_type": bca_type,
                     "yield": m.yield_strength_nmm2,
                     "thickness": m.thickness_mm_as_built,
@@ -297,54 +351,56 @@ def _apply_measure_3(
         })
         return
 
+    # Bitmask of the roles each butt joint connects, parallel to b2b_joints
+    # (unknown member ids contribute no bits)
+    role_bits = {m.member_id: _ROLE_BIT[m.member_role] for m in members}
+    role_masks: List[int] = []
+    for j in b2b_joints:
+        mask = 0
+        for mid in j.connected_members:
+            mask |= role_bits.get(mid, 0)
+        role_masks.append(mask)
+
     if option == Measure3Option.block_shift:
-        _apply_block_shift(measure3_choice, joints, member_map, applications, flags)
+        _apply_block_shift(measure3_choice, b2b_joints, role_masks, applications, flags)
     elif option == Measure3Option.crack_arrest_hole:
-        _apply_crack_arrest_hole(measure3_choice, joints, member_map, applications, flags)
+        _apply_crack_arrest_hole(measure3_choice, b2b_joints, role_masks, applications, flags)
     elif option == Measure3Option.crack_arrest_insert:
-        _apply_crack_arrest_insert(measure3_choice, joints, member_map, applications, flags)
+        _apply_crack_arrest_insert(measure3_choice, b2b_joints, role_masks, applications, flags)
     elif option == Measure3Option.enhanced_NDE:
-        _apply_enhanced_nde(measure3_choice, joints, member_map, applications, flags)
+        _apply_enhanced_nde(measure3_choice, b2b_joints, role_masks, applications, flags)
 
 
 def _apply_block_shift(
     choice: Measure3Choice,
-    joints: List[JointInput],
-    member_map: Dict[str, MemberInput],
+    b2b_joints: List[JointInput],
+    role_masks: List[int],
     applications: List[MeasureApplication],
     flags: List[ManualReviewFlag],
 ) -> None:
     offset = choice.parameters.block_shift_offset_mm
     offset_ok = _is_num(offset) and float(offset) >= 300.0
+    # Only a numeric offset below 300mm is flagged; the message tail is the
+    # same for every joint.
+    offset_short = _is_num(offset) and not offset_ok
+    short_msg_tail = f": block shift offset {offset}mm < 300mm."
 
-    for j in joints:
-        if j.joint_type != JointType.block_to_block_butt:
-            continue
+    for j, role_mask in zip(b2b_joints, role_masks):
         # Check if joint connects coaming side or upper deck
-        roles = {
-            member_map[mid].member_role
-            for mid in j.connected_members
-            if mid in member_map
-        }
-        if roles & {MemberRole.hatch_coaming_side_plate, MemberRole.upper_deck_plate}:
+        if role_mask & _COAMING_OR_DECK_MASK:
             details: Dict[str, Any] = {
-                "description": (
-                    "Block shift: coaming side butt weld vs upper deck butt weld "
-                    "offset must be ≥ 300mm."
-                ),
+                "description": _BLOCK_SHIFT_DESC,
                 "block_shift_offset_mm": offset,
                 "offset_meets_requirement": offset_ok,
             }
-            if _is_num(offset) and not offset_ok:
-                flags.append(ManualReviewFlag(
+            if offset_short:
+                flags.append(ManualReviewFlag.model_construct(
                     flag_id=f"block_shift_short_{j.joint_id}",
                     category="measure_3_block_shift",
-                    message=(
-                        f"Joint {j.joint_id}: block shift offset {offset}mm < 300mm."
-                    ),
+                    message=f"Joint {j.joint_id}{short_msg_tail}",
                     related_ids=[j.joint_id],
                 ))
-            applications.append(MeasureApplication(
+            applications.append(MeasureApplication.model_construct(
                 measure_id=3,
                 measure_name="Block shift requirement",
                 status=MeasureStatus.required,
@@ -357,32 +413,22 @@ def _apply_block_shift(
 
 def _apply_crack_arrest_hole(
     choice: Measure3Choice,
-    joints: List[JointInput],
-    member_map: Dict[str, MemberInput],
+    b2b_joints: List[JointInput],
+    role_masks: List[int],
     applications: List[MeasureApplication],
     flags: List[ManualReviewFlag],
 ) -> None:
     hole_dia = choice.parameters.hole_diameter_mm
-    for j in joints:
-        if j.joint_type != JointType.block_to_block_butt:
-            continue
-        roles = {
-            member_map[mid].member_role
-            for mid in j.connected_members
-            if mid in member_map
-        }
-        if roles & {MemberRole.hatch_coaming_side_plate, MemberRole.upper_deck_plate}:
-            applications.append(MeasureApplication(
+    for j, role_mask in zip(b2b_joints, role_masks):
+        if role_mask & _COAMING_OR_DECK_MASK:
+            applications.append(MeasureApplication.model_construct(
                 measure_id=3,
                 measure_name="Crack arrest hole",
                 status=MeasureStatus.required,
                 target_type=MeasureTarget.joint,
                 target_id=j.joint_id,
                 details={
-                    "description": (
-                        "Crack arrest hole at corner/intersection. "
-                        "Fatigue strength special assessment required."
-                    ),
+                    "description": _CRACK_ARREST_HOLE_DESC,
                     "hole_diameter_mm": hole_dia,
                     "fatigue_assessment_required": True,
                 },
@@ -392,32 +438,22 @@ def _apply_crack_arrest_hole(
 
 def _apply_crack_arrest_insert(
     choice: Measure3Choice,
-    joints: List[JointInput],
-    member_map: Dict[str, MemberInput],
+    b2b_joints: List[JointInput],
+    role_masks: List[int],
     applications: List[MeasureApplication],
     flags: List[ManualReviewFlag],
 ) -> None:
     insert_type = choice.parameters.insert_type
-    for j in joints:
-        if j.joint_type != JointType.block_to_block_butt:
-            continue
-        roles = {
-            member_map[mid].member_role
-            for mid in j.connected_members
-            if mid in member_map
-        }
-        if roles & {MemberRole.hatch_coaming_side_plate, MemberRole.upper_deck_plate}:
-            applications.append(MeasureApplication(
+    for j, role_mask in zip(b2b_joints, role_masks):
+        if role_mask & _COAMING_OR_DECK_MASK:
+            applications.append(MeasureApplication.model_construct(
                 measure_id=3,
                 measure_name="Crack arrest insert plate/weld metal",
                 status=MeasureStatus.required,
                 target_type=MeasureTarget.joint,
                 target_id=j.joint_id,
                 details={
-                    "description": (
-                        "High crack-arrest performance insert plate or "
-                        "weld metal insert required."
-                    ),
+                    "description": _CRACK_ARREST_INSERT_DESC,
                     "insert_type": insert_type,
                 },
                 rule_ref="Measure 3 – crack arrest insert",
@@ -426,21 +462,18 @@ def _apply_crack_arrest_insert(
 
 def _apply_enhanced_nde(
     choice: Measure3Choice,
-    joints: List[JointInput],
-    member_map: Dict[str, MemberInput],
+    b2b_joints: List[JointInput],
+    role_masks: List[int],
     applications: List[MeasureApplication],
     flags: List[ManualReviewFlag],
 ) -> None:
     nde_method = choice.parameters.enhanced_nde_method.value
     criteria_ref = choice.parameters.enhanced_nde_acceptance_criteria_ref
 
-    for j in joints:
-        if j.joint_type != JointType.block_to_block_butt:
-            continue
-
-        # EGW prohibition
+    # EGW prohibition (flags only; usually no joints match)
+    for j in b2b_joints:
         if j.weld_process == WeldProcess.EGW:
-            flags.append(ManualReviewFlag(
+            flags.append(ManualReviewFlag.model_construct(
                 flag_id=f"egw_prohibited_{j.joint_id}",
                 category="measure_3_enhanced_nde",
                 message=(
@@ -450,24 +483,16 @@ def _apply_enhanced_nde(
                 related_ids=[j.joint_id],
             ))
 
-        roles = {
-            member_map[mid].member_role
-            for mid in j.connected_members
-            if mid in member_map
-        }
-        if roles & {MemberRole.hatch_coaming_side_plate, MemberRole.upper_deck_plate,
-                     MemberRole.attached_longitudinal}:
-            applications.append(MeasureApplication(
+    for j, role_mask in zip(b2b_joints, role_masks):
+        if role_mask & _COAMING_DECK_OR_LONG_MASK:
+            applications.append(MeasureApplication.model_construct(
                 measure_id=3,
                 measure_name="Enhanced NDE with stricter acceptance",
                 status=MeasureStatus.required,
                 target_type=MeasureTarget.joint,
                 target_id=j.joint_id,
                 details={
-                    "description": (
-                        "ShipRight-based stricter acceptance criteria. "
-                        "CTOD ≥ 0.18mm required. EGW prohibited."
-                    ),
+                    "description": _ENHANCED_NDE_DESC,
                     "nde_method": nde_method,
                     "acceptance_criteria_ref": criteria_ref,
                     "ctod_min_mm": 0.18,
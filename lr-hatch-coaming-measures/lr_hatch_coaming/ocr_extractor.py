@@ -6,12 +6,19 @@ scanned images/PDFs.  Falls back to manual-matrix input mode on failure.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import re
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib import metadata
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from statistics import fmean
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .models import (
     UNSPECIFIED,
@@ -27,134 +34,205 @@ logger = logging.getLogger(__name__)
 
 # ── OCR back-end abstraction ────────────────────────────────────────────────
 
+# Back-ends are imported on first use: easyocr pulls in torch, which takes
+# seconds, and runs that use the built-in tables never need OCR at all.
 _HAS_TESSERACT = False
 _HAS_EASYOCR = False
-
-try:
-    import pytesseract
-    from PIL import Image
-
-    _HAS_TESSERACT = True
-except ImportError:
-    pass
-
-try:
-    import easyocr
-
-    _HAS_EASYOCR = True
-except ImportError:
-    pass
-
-
-def _ocr_image(image_path: str) -> Tuple[str, float]:
-    """Return (text, avg_confidence) from an image file."""
+_BACKENDS_LOADED = False
+_BACKENDS_LOCK = threading.Lock()
+
+pytesseract: Any = None
+Image: Any = None
+easyocr: Any = None
+
+
+def _load_backends() -> None:
+    """Import the available OCR back-ends once and set the ``_HAS_*`` flags."""
+    global _HAS_TESSERACT, _HAS_EASYOCR, _BACKENDS_LOADED
+    global pytesseract, Image, easyocr
+    if _BACKENDS_LOADED:
+        return
+    with _BACKENDS_LOCK:
+        if _BACKENDS_LOADED:
+            return
+        try:
+            import pytesseract as _pytesseract
+            from PIL import Image as _Image
+
+            pytesseract, Image = _pytesseract, _Image
+            _HAS_TESSERACT = True
+        except ImportError:
+            pass
+
+        try:
+            import easyocr as _easyocr
+
+            easyocr = _easyocr
+            _HAS_EASYOCR = True
+        except ImportError:
+            pass
+        _BACKENDS_LOADED = True
+
+
+# easyocr.Reader loads its detection/recognition models on construction,
+# which takes seconds; keep one per language set for the process lifetime.
+_EASYOCR_READERS: Dict[Tuple[str, ...], Any] = {}
+_EASYOCR_LOCK = threading.Lock()
+
+
+def _get_easyocr_reader(langs: Tuple[str, ...] = ("en",)) -> Any:
+    with _EASYOCR_LOCK:
+        reader = _EASYOCR_READERS.get(langs)
+        if reader is None:
+            reader = _EASYOCR_READERS[langs] = easyocr.Reader(list(langs), gpu=False)
+        return reader
+
+
+def _ocr_image(image: Union[str, "Image.Image"]) -> Tuple[str, float]:
+    """Return (text, avg_confidence) from an image file or PIL image."""
+    _load_backends()
     if _HAS_TESSERACT:
-        img = Image.open(image_path)
+        img = Image.open(image) if isinstance(image, str) else image
         data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
-        texts, confs = [], []
-        for i, txt in enumerate(data["text"]):
+        texts: List[str] = []
+        confs: List[float] = []
+        for txt, c in zip(data["text"], data["conf"]):
             if txt.strip():
                 texts.append(txt)
-                c = data["conf"][i]
                 if isinstance(c, (int, float)) and c >= 0:
-                    confs.append(float(c) / 100.0)
+                    confs.append(c / 100.0)
         full = " ".join(texts)
-        avg = sum(confs) / len(confs) if confs else 0.0
+        avg = fmean(confs) if confs else 0.0
         return full, avg
 
     if _HAS_EASYOCR:
-        reader = easyocr.Reader(["en"], gpu=False)
-        results = reader.readtext(image_path)
-        texts = [r[1] for r in results]
-        confs = [r[2] for r in results]
-        full = " ".join(texts)
-        avg = sum(confs) / len(confs) if confs else 0.0
+        reader = _get_easyocr_reader()
+        if not isinstance(image, str):
+            import numpy as np  # easyocr dependency
+
+            image = np.asarray(image)
+        results = reader.readtext(image)
+        full = " ".join([r[1] for r in results])
+        avg = fmean([r[2] for r in results]) if results else 0.0
         return full, avg
 
     return "", 0.0
 
 
-def _ocr_pdf_page(pdf_path: str, page: int = 0) -> Tuple[str, float]:
-    """Extract text from a single PDF page via rendering + OCR."""
+def _ocr_fitz_page(p: Any) -> Tuple[str, float]:
+    """Text of one PyMuPDF page: embedded text if present, else OCR."""
+    text = p.get_text()
+    if text.strip():
+        return text, 0.95
+    _load_backends()
+    if not (_HAS_TESSERACT or _HAS_EASYOCR):
+        return "", 0.0
+    # Render to an in-memory image and OCR it (no temp file round-trip)
+    from PIL import Image as PILImage
+
+    pix = p.get_pixmap(dpi=300, alpha=False)
+    img = PILImage.frombytes(
+        "RGB" if pix.n == 3 else "L", (pix.width, pix.height), pix.samples
+    )
+    return _ocr_image(img)
+
+
+def _ocr_pdf(pdf_path: str) -> Tuple[str, float]:
+    """Extract text from every page of a PDF.
+
+    Page texts are joined with newlines; the confidence is the mean of the
+    per-page confidences weighted by text length.
+    """
     try:
         import fitz  # PyMuPDF
 
-        doc = fitz.open(pdf_path)
-        p = doc.load_page(page)
-        # Try embedded text first
-        text = p.get_text()
-        if text.strip():
-            doc.close()
-            return text, 0.95
-        # Render to image and OCR
-        pix = p.get_pixmap(dpi=300)
-        img_path = f"/tmp/_ocr_page_{page}.png"
-        pix.save(img_path)
-        doc.close()
-        return _ocr_image(img_path)
+        with fitz.open(pdf_path) as doc:
+            pages = [_ocr_fitz_page(p) for p in doc]
     except ImportError:
         logger.warning("PyMuPDF not available; skipping PDF: %s", pdf_path)
         return "", 0.0
 
+    pages = [(text, conf) for text, conf in pages if text.strip()]
+    if not pages:
+        return "", 0.0
+    total = sum(len(text) for text, _ in pages)
+    avg = sum(conf * len(text) for text, conf in pages) / total
+    return "\n".join(text for text, _ in pages), avg
+
 
 # ── Table parsers ───────────────────────────────────────────────────────────
 
+# Patterns compiled once; the parsers run them on every OCR line.
+_YIELD_RE = re.compile(r"(\d{3})\s*[Nn]/mm")
+_TRANGE_RE = re.compile(r"(\d+)\s*[<≤]\s*t\s*[≤<]\s*(\d+)")
+_TMAX_RE = re.compile(r"t\s*[≤<]\s*(\d+)")
+_STATUS_RE = re.compile(r"(Required|Not\s*required|See\s*Note\s*\d+)", re.IGNORECASE)
+_BCA_RE = re.compile(r"(BCA\s*\d+)", re.IGNORECASE)
+_DIGIT_RE = re.compile(r"\d")
+
+# Keyed by the _STATUS_RE token with whitespace removed and lower-cased
 _STATUS_MAP = {
     "required": MeasureStatus.required,
-    "not required": MeasureStatus.not_required,
-    "see note 2": MeasureStatus.see_note_2,
+    "notrequired": MeasureStatus.not_required,
+    "seenote2": MeasureStatus.see_note_2,
 }
+_WS_RE = re.compile(r"\s+")
 
 
+# Status cells repeat a handful of spellings, so results are memoised.
+@lru_cache(maxsize=64)
 def _parse_status(raw: str) -> MeasureStatus:
-    low = raw.strip().lower()
-    for key, val in _STATUS_MAP.items():
-        if key in low:
-            return val
-    return MeasureStatus.required  # conservative default
+    key = _WS_RE.sub("", raw).lower()
+    return _STATUS_MAP.get(key, MeasureStatus.required)  # conservative default
+
+
+def _content_lines(text: str) -> List[str]:
+    """Stripped, non-empty lines of OCR text (split on ``\\n`` only)."""
+    return [ln for ln in (raw.strip() for raw in text.split("\n")) if ln]
 
 
 def _parse_table_821_from_text(text: str) -> List[Table821Row]:
     """Best-effort table extraction from OCR text for Table 8.2.1."""
+    return _parse_table_821_from_lines(_content_lines(text))
+
+
+def _parse_table_821_from_lines(lines: List[str]) -> List[Table821Row]:
+    """Table 8.2.1 parser over lines from :func:`_content_lines`."""
     rows: List[Table821Row] = []
     # Pattern: yield thickness_range M1 M2 M3+4 M5
     # We look for lines with numbers and Required/Not required patterns
     # This is heuristic — OCR quality varies
-    lines = text.split("\n")
     current_yield = 0
     for line in lines:
-        line = line.strip()
-        if not line:
+        # Yield headers and thickness ranges both need a digit; most OCR
+        # lines (titles, notes, headings) have none and skip the regexes.
+        if not _DIGIT_RE.search(line):
             continue
         # Detect yield header
-        yield_match = re.search(r"(\d{3})\s*[Nn]/mm", line)
+        yield_match = _YIELD_RE.search(line)
         if yield_match:
             current_yield = int(yield_match.group(1))
             continue
         # Detect thickness range + statuses
-        t_match = re.search(
-            r"(\d+)\s*[<≤]\s*t\s*[≤<]\s*(\d+)", line
-        )
-        if not t_match and re.search(r"t\s*[≤<]\s*(\d+)", line):
-            t_match2 = re.search(r"t\s*[≤<]\s*(\d+)", line)
-            if t_match2:
-                t_max = float(t_match2.group(1))
-                t_min = 0.0
-            else:
-                continue
-        elif t_match:
+        t_match = _TRANGE_RE.search(line)
+        if t_match:
             t_min = float(t_match.group(1))
             t_max = float(t_match.group(2))
         else:
-            continue
+            t_match2 = _TMAX_RE.search(line)
+            if not t_match2:
+                continue
+            t_max = float(t_match2.group(1))
+            t_min = 0.0
 
         if current_yield == 0:
             continue
+        low = line.lower()
+        if "equir" not in low and "ote" not in low:
+            continue
 
         # Extract measure statuses — look for "Required" / "Not required" / "See Note"
-        statuses = re.findall(
-            r"(Required|Not\s*required|See\s*Note\s*\d+)", line, re.IGNORECASE
-        )
+        statuses = _STATUS_RE.findall(line)
         if len(statuses) >= 4:
             m1 = _parse_status(statuses[0])
             m2 = _parse_status(statuses[1])
@@ -182,8 +260,12 @@ def _parse_table_821_from_text(text: str) -> List[Table821Row]:
 
 def _parse_table_822_from_text(text: str) -> List[Table822Entry]:
     """Best-effort extraction of Table 8.2.2 BCA type lookup."""
+    return _parse_table_822_from_lines(_content_lines(text))
+
+
+def _parse_table_822_from_lines(lines: List[str]) -> List[Table822Entry]:
+    """Table 8.2.2 parser over lines from :func:`_content_lines`."""
     entries: List[Table822Entry] = []
-    lines = text.split("\n")
     current_cat = ""
     for line in lines:
         low = line.lower()
@@ -192,9 +274,9 @@ def _parse_table_822_from_text(text: str) -> List[Table822Entry]:
         elif "hatch coaming" in low or "coaming side" in low:
             current_cat = "hatch_coaming_side"
 
-        bca_match = re.search(r"(BCA\s*\d+)", line, re.IGNORECASE)
-        t_match = re.search(r"(\d+)\s*[<≤]\s*t\s*[≤<]\s*(\d+)", line)
-        yield_match = re.search(r"(\d{3})\s*[Nn]/mm", line)
+        bca_match = _BCA_RE.search(line)
+        t_match = _TRANGE_RE.search(line)
+        yield_match = _YIELD_RE.search(line)
 
         if bca_match and current_cat:
             bca = bca_match.group(1).replace(" ", "").upper()
@@ -219,61 +301,60 @@ def _extract_textual_requirements(text: str) -> Dict[str, str]:
     reqs: Dict[str, str] = {}
     low = text.lower()
 
+    # First-occurrence offsets, each keyword searched at most once
+    first: Dict[str, int] = {}
+
+    def at(term: str) -> int:
+        idx = first.get(term)
+        if idx is None:
+            idx = first[term] = low.find(term)
+        return idx
+
+    def has(term: str) -> bool:
+        return at(term) >= 0
+
+    def snippet(idx: int, before: int, after: int) -> str:
+        return text[max(0, idx - before) : idx + after].strip()
+
     # Measure 1: 100% UT
-    if "100%" in text and ("ut" in low or "ultrasonic" in low):
-        idx = low.find("100%")
-        snippet = text[max(0, idx - 50) : idx + 200]
-        reqs["measure_1_ut_requirement"] = snippet.strip()
+    if has("100%") and (has("ut") or has("ultrasonic")):
+        reqs["measure_1_ut_requirement"] = snippet(at("100%"), 50, 200)
 
     # Measure 3 sub-options
-    if "block shift" in low or "300" in text:
-        idx = low.find("block shift") if "block shift" in low else low.find("300")
-        snippet = text[max(0, idx - 50) : idx + 300]
-        reqs["measure_3_block_shift"] = snippet.strip()
-
-    if "crack arrest hole" in low:
-        idx = low.find("crack arrest hole")
-        snippet = text[max(0, idx - 50) : idx + 300]
-        reqs["measure_3_crack_arrest_hole"] = snippet.strip()
-
-    if "insert" in low and ("crack arrest" in low or "weld metal" in low):
-        idx = low.find("insert")
-        snippet = text[max(0, idx - 80) : idx + 300]
-        reqs["measure_3_insert"] = snippet.strip()
-
-    if "enhanced" in low and "nde" in low:
-        idx = low.find("enhanced")
-        snippet = text[max(0, idx - 50) : idx + 400]
-        reqs["measure_3_enhanced_nde"] = snippet.strip()
-
-    if "ctod" in low or "0.18" in text:
-        idx = low.find("ctod") if "ctod" in low else low.find("0.18")
-        snippet = text[max(0, idx - 50) : idx + 200]
-        reqs["ctod_requirement"] = snippet.strip()
-
-    if "bca" in low or "brittle crack arrest" in low:
-        idx = low.find("bca") if "bca" in low else low.find("brittle crack arrest")
-        snippet = text[max(0, idx - 50) : idx + 300]
-        reqs["bca_steel_requirement"] = snippet.strip()
+    if has("block shift") or has("300"):
+        idx = at("block shift") if has("block shift") else at("300")
+        reqs["measure_3_block_shift"] = snippet(idx, 50, 300)
+
+    if has("crack arrest hole"):
+        reqs["measure_3_crack_arrest_hole"] = snippet(at("crack arrest hole"), 50, 300)
+
+    if has("insert") and (has("crack arrest") or has("weld metal")):
+        reqs["measure_3_insert"] = snippet(at("insert"), 80, 300)
+
+    if has("enhanced") and has("nde"):
+        reqs["measure_3_enhanced_nde"] = snippet(at("enhanced"), 50, 400)
+
+    if has("ctod") or has("0.18"):
+        idx = at("ctod") if has("ctod") else at("0.18")
+        reqs["ctod_requirement"] = snippet(idx, 50, 200)
+
+    if has("bca") or has("brittle crack arrest"):
+        idx = at("bca") if has("bca") else at("brittle crack arrest")
+        reqs["bca_steel_requirement"] = snippet(idx, 50, 300)
 
     # PJP weld
-    if "pjp" in low or "partial joint penetration" in low:
-        term = "pjp" if "pjp" in low else "partial joint penetration"
-        idx = low.find(term)
-        snippet = text[max(0, idx - 50) : idx + 300]
-        reqs["pjp_weld_requirement"] = snippet.strip()
+    if has("pjp") or has("partial joint penetration"):
+        idx = at("pjp") if has("pjp") else at("partial joint penetration")
+        reqs["pjp_weld_requirement"] = snippet(idx, 50, 300)
 
     # Thickness > 100 special
-    if "special consideration" in low or ("100" in text and "thick" in low):
-        idx = low.find("special consideration") if "special consideration" in low else low.find("100")
-        snippet = text[max(0, idx - 50) : idx + 300]
-        reqs["thickness_gt100_special"] = snippet.strip()
+    if has("special consideration") or (has("100") and has("thick")):
+        idx = at("special consideration") if has("special consideration") else at("100")
+        reqs["thickness_gt100_special"] = snippet(idx, 50, 300)
 
     # EGW prohibition
-    if "egw" in low and ("not" in low or "prohib" in low or "shall not" in low):
-        idx = low.find("egw")
-        snippet = text[max(0, idx - 80) : idx + 200]
-        reqs["egw_prohibition"] = snippet.strip()
+    if has("egw") and (has("not") or has("prohib") or has("shall not")):
+        reqs["egw_prohibition"] = snippet(at("egw"), 80, 200)
 
     return reqs
 
@@ -298,32 +379,145 @@ def crop_snippet(
 
 # ── Main extraction orchestrator ────────────────────────────────────────────
 
+_IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".tiff", ".bmp")
+
+# With tesseract, image files are OCR'd on a small thread pool when there is
+# more than one: tesseract runs as a subprocess, so the workers mostly wait
+# outside the GIL.  The easyocr fallback shares one Reader whose model is not
+# known to be thread-safe and already uses several CPU threads, so its inputs
+# stay on the calling thread, as PDFs do (PyMuPDF does not support use from
+# multiple threads).
+_MAX_OCR_WORKERS = 8
+
+
+def _ocr_file(fpath: str) -> Tuple[str, float]:
+    if fpath.lower().endswith(".pdf"):
+        return _ocr_pdf(fpath)
+    return _ocr_image(fpath)
+
+
+_backend_versions_cache: Optional[str] = None
+
+
+def _backend_versions() -> str:
+    """Installed OCR package versions, read without importing the packages."""
+    global _backend_versions_cache
+    if _backend_versions_cache is None:
+        parts = []
+        for dist in ("pytesseract", "easyocr", "PyMuPDF"):
+            try:
+                parts.append(f"{dist}={metadata.version(dist)}")
+            except metadata.PackageNotFoundError:
+                parts.append(f"{dist}=-")
+        _backend_versions_cache = ";".join(parts)
+    return _backend_versions_cache
+
+
+def _ocr_file_cached(
+    fpath: str, st: os.stat_result, cache_dir: Optional[str]
+) -> Tuple[str, float]:
+    """:func:`_ocr_file` with an on-disk result cache under ``cache_dir``.
+
+    ``st`` is the ``os.stat`` result taken when the file was checked.
+    Entries are keyed on the file's mtime, size and the installed OCR package
+    versions (a tesseract binary upgrade alone does not invalidate them).
+    Empty results are not cached, so a later run with a working back-end
+    retries.
+    """
+    if cache_dir is None:
+        return _ocr_file(fpath)
+    key = [st.st_mtime_ns, st.st_size, _backend_versions()]
+    digest = hashlib.sha1(os.path.abspath(fpath).encode("utf-8")).hexdigest()
+    entry_path = os.path.join(cache_dir, f"{digest}.json")
+    try:
+        with open(entry_path, encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry["key"] == key:
+            return entry["text"], entry["conf"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    text, conf = _ocr_file(fpath)
+    if text.strip():
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "text": text, "conf": conf}, f, ensure_ascii=False)
+            os.replace(tmp_path, entry_path)
+        except OSError as exc:
+            logger.warning("Could not write OCR cache entry for %s: %s", fpath, exc)
+    return text, conf
+
+
 def extract_rules(
     scanned_images: List[ScannedRuleImage],
     evidence_dir: Optional[str] = None,
+    cache_dir: Optional[str] = None,
 ) -> RulesExtraction:
     """Extract rules from scanned images/PDFs.
 
     If OCR is unavailable or fails, returns an empty extraction with
     warnings — the caller should then offer manual-matrix input mode.
+    When ``cache_dir`` is given, OCR results are cached there across runs.
     """
     result = RulesExtraction()
     all_text_parts: List[str] = []
 
+    # Decide per file first, OCR the eligible ones (in parallel when there
+    # are several), then merge everything back in input order.
+    # One stat per file: it answers the existence check and feeds the OCR
+    # cache key.
+    plan: List[Tuple[ScannedRuleImage, str]] = []  # (src, skip warning)
+    ocr_paths: List[str] = []
+    ocr_stats: List[os.stat_result] = []
     for src in scanned_images:
         fpath = src.file_path
-        if not os.path.isfile(fpath):
-            result.extraction_warnings.append(f"File not found: {fpath}")
+        try:
+            st = os.stat(fpath)
+        except (OSError, ValueError):
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            plan.append((src, f"File not found: {fpath}"))
             continue
-
         ext = os.path.splitext(fpath)[1].lower()
-        if ext == ".pdf":
-            text, conf = _ocr_pdf_page(fpath, page=0)
-        elif ext in (".png", ".jpg", ".jpeg", ".tiff", ".bmp"):
-            text, conf = _ocr_image(fpath)
+        if ext != ".pdf" and ext not in _IMAGE_EXTS:
+            plan.append((src, f"Unsupported file type: {fpath}"))
         else:
-            result.extraction_warnings.append(f"Unsupported file type: {fpath}")
+            plan.append((src, ""))
+            ocr_paths.append(fpath)
+            ocr_stats.append(st)
+
+    ocr_one = partial(_ocr_file_cached, cache_dir=cache_dir)
+    outputs: List[Tuple[str, float]] = [("", 0.0)] * len(ocr_paths)
+    image_jobs: List[int] = []
+    for i, fp in enumerate(ocr_paths):
+        if fp.lower().endswith(".pdf"):
+            outputs[i] = ocr_one(fp, ocr_stats[i])
+        else:
+            image_jobs.append(i)
+    _load_backends()
+    if _HAS_TESSERACT and len(image_jobs) > 1:
+        workers = min(_MAX_OCR_WORKERS, len(image_jobs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            done = pool.map(
+                ocr_one,
+                [ocr_paths[i] for i in image_jobs],
+                [ocr_stats[i] for i in image_jobs],
+            )
+            for i, out in zip(image_jobs, done):
+                outputs[i] = out
+    else:
+        for i in image_jobs:
+            outputs[i] = ocr_one(ocr_paths[i], ocr_stats[i])
+    ocr_results = iter(outputs)
+
+    for src, skip_warning in plan:
+        fpath = src.file_path
+        if skip_warning:
+            result.extraction_warnings.append(skip_warning)
             continue
+        text, conf = next(ocr_results)
 
         if not text.strip():
             result.extraction_warnings.append(
@@ -339,8 +533,9 @@ def extract_rules(
     combined = "\n".join(all_text_parts)
 
     if combined.strip():
-        result.table_821 = _parse_table_821_from_text(combined)
-        result.table_822 = _parse_table_822_from_text(combined)
+        lines = _content_lines(combined)
+        result.table_821 = _parse_table_821_from_lines(lines)
+        result.table_822 = _parse_table_822_from_lines(lines)
         result.textual_requirements = _extract_textual_requirements(combined)
 
         if not result.table_821:
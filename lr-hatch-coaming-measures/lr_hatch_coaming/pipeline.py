@@ -6,7 +6,6 @@ Runs: OCR → Rule merge → Decision → Measure application →
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 from typing import Any, Dict, Optional
@@ -26,7 +25,7 @@ from .decision_engine import run_decision
 from .measure_applicator import apply_measures
 from .viz_2d import write_2d_outputs
 from .viz_3d import write_3d_outputs
-from .evidence import write_audit_json, write_evidence
+from .evidence import write_audit_json, write_evidence, write_summary_json
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +52,7 @@ def run_pipeline(
     ocr_result = extract_rules(
         pipeline_input.sources.scanned_rule_images,
         evidence_dir=os.path.join(output_dir, "evidence", "ocr_snippets"),
+        cache_dir=os.path.join(output_dir, ".ocr_cache"),
     )
 
     # ── Step 2: Merge with defaults ─────────────────────────────────────
@@ -146,10 +146,7 @@ def run_pipeline(
         },
     }
 
-    # Write summary
-    summary_path = os.path.join(output_dir, "pipeline_summary.json")
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+    write_summary_json(output_dir, summary)
 
     logger.info("Pipeline complete. Output at: %s", output_dir)
     return summary
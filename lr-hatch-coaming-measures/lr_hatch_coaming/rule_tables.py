@@ -9,7 +9,8 @@ Reference: LR Rules for the Classification of Ships – Part 3, Ch 4, Sec 8.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from .models import (
     UNSPECIFIED,
@@ -27,7 +28,7 @@ from .models import (
 
 _S = MeasureStatus
 
-_DEFAULT_TABLE_821: List[Table821Row] = [
+_DEFAULT_TABLE_821: Tuple[Table821Row, ...] = (
     # ── Yield = 355 N/mm² ──
     Table821Row(
         yield_strength_nmm2=355,
@@ -166,10 +167,10 @@ _DEFAULT_TABLE_821: List[Table821Row] = [
         measure_3_and_4=TableCell(status=_S.required),
         measure_5=TableCell(status=_S.required),
     ),
-]
+)
 
 # ── Table 8.2.2 defaults (BCA type assignment) ─────────────────────────────
-_DEFAULT_TABLE_822: List[Table822Entry] = [
+_DEFAULT_TABLE_822: Tuple[Table822Entry, ...] = (
     # Upper deck
     Table822Entry(
         member_category="upper_deck",
@@ -270,19 +271,21 @@ _DEFAULT_TABLE_822: List[Table822Entry] = [
         t_min_mm=65, t_max_mm=100,
         bca_type="BCA2",
     ),
-]
+)
 
 
 def get_default_table_821() -> List[Table821Row]:
+    """Fresh list over the shared (immutable) default rows."""
     return list(_DEFAULT_TABLE_821)
 
 
 def get_default_table_822() -> List[Table822Entry]:
+    """Fresh list over the shared (immutable) default entries."""
     return list(_DEFAULT_TABLE_822)
 
 
 def lookup_table_821(
-    table: List[Table821Row],
+    table: Sequence[Table821Row],
     yield_strength: int,
     thickness: float,
 ) -> Optional[Table821Row]:
@@ -298,8 +301,62 @@ def lookup_table_821(
     return None
 
 
+# Dense index covering 0 ≤ t ≤ 100 mm; thicker plates are special
+# consideration and never reach the table in the decision engine.
+_INDEX_MAX_T_MM = 100
+
+# Single-slot binding for the indexed Table 8.2.1 lookup: a private copy of
+# the rows the index was built from, plus the index.  Every call compares
+# the passed table with that copy (list ==, identity first, ~80 ns for the
+# defaults), so rows replaced in place or a different table rebuild the
+# index, while another copy of the same rows keeps it.  The binding is
+# swapped as one tuple, so concurrent callers never pair one table's rows
+# with another table's index.
+_Index821 = Optional[Dict[int, List[Optional[Table821Row]]]]
+_binding_821: Tuple[List[Table821Row], _Index821] = ([], {})
+
+
+def build_table821_index(
+    table: Sequence[Table821Row],
+) -> Optional[Dict[int, List[Optional[Table821Row]]]]:
+    """Materialise Table 8.2.1 as ``{yield: [row for t = 0..100 mm]}``.
+
+    Slot ``k`` holds the row for any thickness in ``(k-1, k]``, which is exact
+    as long as every row boundary is a whole millimetre.  Returns None for
+    tables with fractional boundaries; callers then fall back to the scan.
+    """
+    if any(r.t_min_mm % 1 or r.t_max_mm % 1 for r in table):
+        return None
+    return {
+        y: [lookup_table_821(table, y, float(k)) for k in range(_INDEX_MAX_T_MM + 1)]
+        for y in {r.yield_strength_nmm2 for r in table}
+    }
+
+
+def lookup_table_821_cached(
+    table: List[Table821Row],
+    yield_strength: int,
+    thickness: float,
+) -> Optional[Table821Row]:
+    """Indexed :func:`lookup_table_821` — O(1) after the first call per table.
+
+    Rows may be replaced in the list between calls; the row objects
+    themselves are treated as immutable.
+    """
+    global _binding_821
+    snapshot, index = _binding_821
+    if snapshot != table:
+        snapshot = list(table)
+        index = build_table821_index(snapshot)
+        _binding_821 = (snapshot, index)
+    if index is not None and 0 <= thickness <= _INDEX_MAX_T_MM:
+        slots = index.get(yield_strength)
+        return slots[math.ceil(thickness)] if slots is not None else None
+    return lookup_table_821(table, yield_strength, thickness)
+
+
 def lookup_table_822(
-    table: List[Table822Entry],
+    table: Sequence[Table822Entry],
     member_category: str,
     yield_strength: int,
     thickness: float,
@@ -317,6 +374,57 @@ def lookup_table_822(
     return None
 
 
+# Process-wide memo for Table 8.2.2 lookups, bound to one table at a time
+# the same way as the Table 8.2.1 index: (entry copy, buckets, memo),
+# swapped as one tuple.  Misses scan only the (category, yield) bucket,
+# which keeps the entries in table order.
+_MEMO_822_MAX = 2048
+_binding_822: Tuple[
+    List[Table822Entry],
+    Dict[Tuple[str, int], List[Table822Entry]],
+    Dict[Tuple[str, int, float], Optional[Table822Entry]],
+] = ([], {}, {})
+
+
+def _bucket_table_822(
+    table: Sequence[Table822Entry],
+) -> Dict[Tuple[str, int], List[Table822Entry]]:
+    buckets: Dict[Tuple[str, int], List[Table822Entry]] = {}
+    for entry in table:
+        buckets.setdefault((entry.member_category, entry.yield_strength_nmm2), []).append(entry)
+    return buckets
+
+
+def lookup_table_822_cached(
+    table: List[Table822Entry],
+    member_category: str,
+    yield_strength: int,
+    thickness: float,
+) -> Optional[Table822Entry]:
+    """Memoised :func:`lookup_table_822`.
+
+    As with :func:`lookup_table_821_cached`, entries may be replaced in the
+    list between calls but must not themselves be mutated.
+    """
+    global _binding_822
+    snapshot, buckets, memo = _binding_822
+    if snapshot != table:
+        snapshot = list(table)
+        buckets = _bucket_table_822(snapshot)
+        memo = {}
+        _binding_822 = (snapshot, buckets, memo)
+    key = (member_category, yield_strength, thickness)
+    try:
+        return memo[key]
+    except KeyError:
+        pass
+    if len(memo) >= _MEMO_822_MAX:
+        memo.clear()
+    bucket = buckets.get((member_category, yield_strength), ())
+    entry = memo[key] = lookup_table_822(bucket, *key)
+    return entry
+
+
 def merge_ocr_with_defaults(ocr_extraction: RulesExtraction) -> RulesExtraction:
     """Merge OCR-extracted tables with defaults, preferring OCR where available."""
     result = RulesExtraction(
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 import math
 import os
-from typing import Any, Dict, List, Optional, Union
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .models import (
     UNSPECIFIED,
@@ -86,6 +87,39 @@ def _text(x: float, y: float, txt: str, cls: str = "label",
     return f'<text x="{x}" y="{y}" class="{cls}" text-anchor="{anchor}">{txt}</text>'
 
 
+def _parse_hex(color: str) -> Optional[Tuple[int, int, int]]:
+    h = color[1:] if color.startswith("#") else ""
+    if len(h) == 3:
+        h = "".join(ch * 2 for ch in h)
+    if len(h) != 6:
+        return None
+    try:
+        return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+    except ValueError:
+        return None
+
+
+def _composite(layers: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+    """Flatten stacked (colour, opacity) fills of one shape into one layer.
+
+    Porter–Duff "over", bottom layer first, so a single element renders the
+    same as the stack.  Layers whose colour is not ``#rgb``/``#rrggbb`` are
+    returned unchanged.
+    """
+    if len(layers) < 2:
+        return layers
+    rgbs = [_parse_hex(c) for c, _ in layers]
+    if any(rgb is None for rgb in rgbs):
+        return layers
+    acc = [0.0, 0.0, 0.0]  # premultiplied
+    alpha = 0.0
+    for rgb, (_, a) in zip(rgbs, layers):
+        acc = [v * (1 - a) + ch * a for v, ch in zip(acc, rgb)]
+        alpha = alpha * (1 - a) + a
+    r, g, b = (min(255, round(v / alpha)) for v in acc)
+    return [(f"#{r:02X}{g:02X}{b:02X}", round(alpha, 4))]
+
+
 def _circle(cx: float, cy: float, r: float, fill: str, stroke: str = "#000",
             sw: float = 1) -> str:
     return (
@@ -118,9 +152,9 @@ def generate_plan_svg(
     H = sB + 2 * margin + 80  # extra for legend
 
     # Build target → measures map
-    target_measures: Dict[str, List[MeasureApplication]] = {}
+    target_measures: Dict[str, List[MeasureApplication]] = defaultdict(list)
     for app in applications:
-        target_measures.setdefault(app.target_id, []).append(app)
+        target_measures[app.target_id].append(app)
 
     # Patterns
     patterns = []
@@ -158,24 +192,29 @@ def generate_plan_svg(
     parts.append(_rect(ox - coam_w, oy - deck_h - top_h, coam_w + sL + coam_w, top_h,
                         fill="#FFF3E0", stroke="#E65100"))
 
-    # Overlay measure colours on members
+    # Overlay measure colours on members: role → (x, y, w, h) strips
+    member_strips = {
+        MemberRole.upper_deck_plate: (
+            (ox, oy - deck_h, sL, deck_h),
+            (ox, oy + sB, sL, deck_h),
+        ),
+        MemberRole.hatch_coaming_side_plate: (
+            (ox - coam_w, oy, coam_w, sB),
+            (ox + sL, oy, coam_w, sB),
+        ),
+    }
     for m in members:
+        strips = member_strips.get(m.member_role)
         apps = target_measures.get(m.member_id, [])
-        if not apps:
+        if not strips or not apps:
             continue
-        for i, app in enumerate(apps):
-            c = colors.get(app.measure_id, "#888")
-            alpha = max(0.15, 0.35 - i * 0.05)
-            if m.member_role == MemberRole.upper_deck_plate:
-                parts.append(_rect(ox, oy - deck_h, sL, deck_h,
-                                   fill=c, opacity=alpha))
-                parts.append(_rect(ox, oy + sB, sL, deck_h,
-                                   fill=c, opacity=alpha))
-            elif m.member_role == MemberRole.hatch_coaming_side_plate:
-                parts.append(_rect(ox - coam_w, oy, coam_w, sB,
-                                   fill=c, opacity=alpha))
-                parts.append(_rect(ox + sL, oy, coam_w, sB,
-                                   fill=c, opacity=alpha))
+        layers = _composite([
+            (colors.get(app.measure_id, "#888"), max(0.15, 0.35 - i * 0.05))
+            for i, app in enumerate(apps)
+        ])
+        for c, alpha in layers:
+            for x, y, w, h in strips:
+                parts.append(_rect(x, y, w, h, fill=c, opacity=alpha))
 
     # Joints as lines/symbols
     n_joints = max(len(joints), 1)
@@ -237,9 +276,9 @@ def generate_section_svg(
     W = sB + 2 * margin
     H_svg = sH + 2 * margin + 80
 
-    target_measures: Dict[str, List[MeasureApplication]] = {}
+    target_measures: Dict[str, List[MeasureApplication]] = defaultdict(list)
     for app in applications:
-        target_measures.setdefault(app.target_id, []).append(app)
+        target_measures[app.target_id].append(app)
 
     parts: List[str] = []
     parts.append(_SVG_HEADER.format(
@@ -270,20 +309,29 @@ def generate_section_svg(
     parts.append(_rect(ox, oy, sB, sH, fill="none", stroke="#263238", sw=1, extra='stroke-dasharray="4,4"'))
     parts.append(_text(ox + sB / 2, oy + sH / 2, "Hatch\nOpening", "dim"))
 
-    # Member overlays
+    # Member overlays: role → (x, y, w, h) bars
+    member_bars = {
+        MemberRole.upper_deck_plate: ((ox, oy + sH, sB, deck_t),),
+        MemberRole.hatch_coaming_side_plate: (
+            (ox - coam_w, oy, coam_w, sH),
+            (ox + sB, oy, coam_w, sH),
+        ),
+        MemberRole.hatch_coaming_top_plate: (
+            (ox - coam_w, oy - top_t, coam_w * 2 + sB, top_t),
+        ),
+    }
     for m in members:
+        bars = member_bars.get(m.member_role)
         apps = target_measures.get(m.member_id, [])
-        for i, app in enumerate(apps):
-            c = colors.get(app.measure_id, "#888")
-            alpha = max(0.15, 0.4 - i * 0.05)
-            if m.member_role == MemberRole.upper_deck_plate:
-                parts.append(_rect(ox, oy + sH, sB, deck_t, fill=c, opacity=alpha))
-            elif m.member_role == MemberRole.hatch_coaming_side_plate:
-                parts.append(_rect(ox - coam_w, oy, coam_w, sH, fill=c, opacity=alpha))
-                parts.append(_rect(ox + sB, oy, coam_w, sH, fill=c, opacity=alpha))
-            elif m.member_role == MemberRole.hatch_coaming_top_plate:
-                parts.append(_rect(ox - coam_w, oy - top_t,
-                                   coam_w * 2 + sB, top_t, fill=c, opacity=alpha))
+        if not bars or not apps:
+            continue
+        layers = _composite([
+            (colors.get(app.measure_id, "#888"), max(0.15, 0.4 - i * 0.05))
+            for i, app in enumerate(apps)
+        ])
+        for c, alpha in layers:
+            for x, y, w, h in bars:
+                parts.append(_rect(x, y, w, h, fill=c, opacity=alpha))
 
     # Joint overlays
     for j in joints:
@@ -10,6 +10,7 @@ import json
 import math
 import os
 import struct
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .models import (
@@ -88,9 +89,9 @@ def build_glb(
     sc = 0.001
     sL, sB, sH = L * sc, B * sc, Hc * sc
 
-    target_measures: Dict[str, List[MeasureApplication]] = {}
+    target_measures: Dict[str, List[MeasureApplication]] = defaultdict(list)
     for app in applications:
-        target_measures.setdefault(app.target_id, []).append(app)
+        target_measures[app.target_id].append(app)
 
     # Collect meshes: (positions, indices, color_rgba)
     mesh_data: List[Tuple[List[float], List[int], List[float], str]] = []
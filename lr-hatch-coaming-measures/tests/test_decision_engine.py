@@ -13,9 +13,11 @@ import pytest
 from lr_hatch_coaming.models import (
     UNSPECIFIED,
     ControlParameters,
+    ManualReviewFlag,
     Measure3Choice,
     Measure3Option,
     Measure3Parameters,
+    MeasureApplication,
     MeasureStatus,
     MemberInput,
     MemberRole,
@@ -35,7 +37,15 @@ from lr_hatch_coaming.decision_engine import (
     run_decision,
 )
 from lr_hatch_coaming.measure_applicator import apply_measures
-from lr_hatch_coaming.rule_tables import get_default_table_821, get_default_table_822
+from lr_hatch_coaming.rule_tables import (
+    get_default_table_821,
+    get_default_table_822,
+    build_table821_index,
+    lookup_table_821,
+    lookup_table_821_cached,
+    lookup_table_822,
+    lookup_table_822_cached,
+)
 
 
 # ── Fixtures ────────────────────────────────────────────────────────────────
@@ -231,6 +241,18 @@ class TestCase2_EH40_47:
         assert 5 in measure_ids  # BCA upper deck (traceability)
         assert 0 in measure_ids  # PJP
 
+    def test_applications_and_flags_validate(self):
+        """Unvalidated construction must still yield schema-valid models."""
+        cp, req, info, flags = run_decision(self.pi_enhanced, self.table_821)
+        apps, app_flags, _ = apply_measures(
+            req, self.pi_enhanced.members, self.pi_enhanced.joints,
+            self.pi_enhanced.measure3_choice, get_default_table_822(),
+        )
+        for a in apps:
+            assert MeasureApplication.model_validate(a.model_dump()) == a
+        for f in app_flags:
+            assert ManualReviewFlag.model_validate(f.model_dump()) == f
+
     def test_bca_assigned_to_side_plate(self):
         """Measure 3 should assign BCA steel to coaming side plate."""
         cp, req, info, flags = run_decision(self.pi_enhanced, self.table_821)
@@ -306,6 +328,19 @@ class TestCase3_ThickGT100:
         thick_flags = [f for f in app_flags if "thick_gt100" in f.flag_id]
         assert len(thick_flags) >= 1
 
+    def test_measure_4_and_5_share_bca_and_keep_order(self):
+        cp, req, _, _ = run_decision(self.pi, self.table_821)
+        apps, _, _ = apply_measures(
+            req, self.pi.members, self.pi.joints,
+            self.pi.measure3_choice, get_default_table_822(),
+        )
+        m45 = [a for a in apps if a.measure_id in (4, 5)]
+        ids = [a.measure_id for a in m45]
+        assert ids == sorted(ids) and set(ids) == {4, 5}
+        m4 = {a.target_id: a.details["bca_type"] for a in m45 if a.measure_id == 4}
+        m5 = {a.target_id: a.details["bca_type"] for a in m45 if a.measure_id == 5}
+        assert m4 == m5
+
 
 # ── Edge cases ──────────────────────────────────────────────────────────────
 
@@ -330,6 +365,47 @@ class TestEdgeCases:
         cp, flags = derive_control_parameters(members)
         assert cp.t_control == UNSPECIFIED
 
+    def test_float_subclass_assigned_after_validation(self):
+        """A float subclass (e.g. numpy.float64) set after construction is a number."""
+        class Float64(float):
+            pass
+
+        pi = _make_pipeline(390, 70.0, 390, 65.0)
+        pi.members[0].thickness_mm_as_built = Float64(72.0)
+        cp, _ = derive_control_parameters(pi.members)
+        assert cp.t_control == 72.0
+
+    def test_duplicate_member_id_last_wins_for_measures_1_and_2(self):
+        """A repeated member_id resolves to its last member, as the role map does."""
+        req = {
+            1: MeasureStatus.required,
+            2: MeasureStatus.conditional,
+            3: MeasureStatus.not_required,
+            4: MeasureStatus.not_required,
+            5: MeasureStatus.not_required,
+        }
+        dup = MemberInput(member_id="DECK-01", member_role=MemberRole.other)
+        pi = _make_pipeline(
+            390, 90.0, 460, 85.0,
+            m3_option=Measure3Option.enhanced_NDE,
+            nde_method=EnhancedNDEMethod.PAUT,
+            extra_members=[dup],
+        )
+        apps, _, _ = apply_measures(
+            req, pi.members, pi.joints, pi.measure3_choice, get_default_table_822(),
+        )
+        assert not [a for a in apps if a.measure_id in (1, 2)]
+
+        # Upper-flange role last: the joint qualifies again.
+        pi.members.remove(dup)
+        pi.members.insert(0, dup)
+        apps, _, _ = apply_measures(
+            req, pi.members, pi.joints, pi.measure3_choice, get_default_table_822(),
+        )
+        assert [(a.measure_id, a.target_id) for a in apps if a.measure_id in (1, 2)] == [
+            (1, "J-BUTT-01"), (2, "J-BUTT-01"),
+        ]
+
     def test_note_2_not_applied_without_enhanced_nde(self):
         """Even if table says See Note 2, M2 stays Not required without enhanced_NDE."""
         table = get_default_table_821()
@@ -369,3 +445,94 @@ class TestEdgeCases:
         assert len(pending) >= 1
         assert pending[0]["measure_id"] == 3
         assert pending[0]["status"] == "pending_manual_choice"
+
+    def test_grade_check_460(self):
+        pi = _make_pipeline(
+            side_yield=460, side_thickness=45.0,
+            top_yield=460, top_thickness=45.0,
+        )
+        pi.members[0].grade = "eh47"
+        pi.members[1].grade = "AH47"
+        _, _, _, flags = run_decision(pi, get_default_table_821())
+        grade_flags = {f.flag_id for f in flags if f.category == "grade_validation"}
+        assert grade_flags == {"grade_check_TOP-01"}
+
+    def test_lookup_info_can_be_skipped(self):
+        table_821 = get_default_table_821()
+        pi = _make_pipeline(390, 70.0, 390, 65.0, m3_option=Measure3Option.block_shift)
+        _, req_full, info_full, _ = run_decision(pi, table_821)
+        _, req_bare, info_bare, _ = run_decision(pi, table_821, capture_lookup_info=False)
+        assert req_bare == req_full
+        assert "matched_row" in info_full and "note_2_reason" in info_full
+        assert info_bare == {}
+
+
+# ── Rule table lookups ──────────────────────────────────────────────────────
+
+class TestRuleTableLookup:
+
+    def test_cached_821_matches_scan(self):
+        table = get_default_table_821()
+        for y in (355, 390, 460, 500):
+            for t in (0.0, 30.0, 40.5, 50.0, 50.1, 65.0, 85.0, 99.9, 100.0, 101.0):
+                assert lookup_table_821_cached(table, y, t) is lookup_table_821(table, y, t)
+
+    def test_cached_821_rebinds_on_new_table(self):
+        table = get_default_table_821()
+        assert lookup_table_821_cached(table, 355, 55.0) is not None
+        # A different table object must not be served from the old cache.
+        assert lookup_table_821_cached([], 355, 55.0) is None
+
+    def test_cached_821_index_kept_for_copy_of_defaults(self, monkeypatch):
+        from lr_hatch_coaming import rule_tables
+
+        row = lookup_table_821_cached(get_default_table_821(), 355, 55.0)
+        monkeypatch.setattr(rule_tables, "build_table821_index", None)  # must not rebuild
+        assert lookup_table_821_cached(get_default_table_821(), 355, 55.0) is row
+
+    def test_cached_821_sees_rows_replaced_in_place(self):
+        table = get_default_table_821()
+        i = table.index(lookup_table_821(table, 355, 55.0))
+        assert lookup_table_821_cached(table, 355, 55.0).measure_1.status == MeasureStatus.required
+        table[i] = table[i].model_copy(update={
+            "measure_1": table[i].measure_1.model_copy(update={"status": MeasureStatus.not_required}),
+        })
+        assert lookup_table_821_cached(table, 355, 55.0) is table[i]
+        assert lookup_table_821_cached(table, 355, 55.0).measure_1.status == MeasureStatus.not_required
+
+    def test_index_skipped_for_fractional_bounds(self):
+        table = get_default_table_821()
+        table[0] = table[0].model_copy(update={"t_max_mm": 50.5})
+        assert build_table821_index(table) is None
+        assert lookup_table_821_cached(table, 355, 50.3) is table[0]
+
+    def test_cached_822_matches_scan_and_rebinds(self):
+        table = get_default_table_822()
+        for cat in ("upper_deck", "hatch_coaming_side"):
+            for y in (355, 390, 460):
+                for t in (40.0, 50.0, 80.0, 100.0):
+                    assert lookup_table_822_cached(table, cat, y, t) is lookup_table_822(table, cat, y, t)
+        hit = lookup_table_822_cached(table, "upper_deck", 390, 80.0)
+        # A fresh copy of the defaults may reuse the memo ...
+        assert lookup_table_822_cached(get_default_table_822(), "upper_deck", 390, 80.0) is hit
+        # ... but a table with different entries must not.
+        assert lookup_table_822_cached([], "upper_deck", 390, 80.0) is None
+
+    def test_cached_822_sees_entries_replaced_in_place(self):
+        table = get_default_table_822()
+        hit = lookup_table_822_cached(table, "upper_deck", 390, 80.0)
+        i = table.index(hit)
+        table[i] = hit.model_copy(update={"bca_type": "BCA9"})
+        assert lookup_table_822_cached(table, "upper_deck", 390, 80.0).bca_type == "BCA9"
+
+    def test_cached_822_keeps_first_match_within_bucket(self):
+        first, second = get_default_table_822()[:2]
+        overlap = second.model_copy(update={
+            "member_category": first.member_category,
+            "yield_strength_nmm2": first.yield_strength_nmm2,
+            "t_min_mm": first.t_min_mm,
+            "t_max_mm": first.t_max_mm,
+        })
+        table = [overlap, first]
+        t = first.t_max_mm
+        assert lookup_table_822_cached(table, first.member_category, first.yield_strength_nmm2, t) is overlap
@@ -13,6 +13,8 @@ import tempfile
 import pytest
 
 from lr_hatch_coaming.models import (
+    ControlParameters,
+    DecisionResult,
     HatchOpeningBbox,
     Measure3Choice,
     Measure3Option,
@@ -23,13 +25,16 @@ from lr_hatch_coaming.models import (
     JointType,
     PipelineInput,
     ProjectMeta,
+    RulesExtraction,
     Sources,
     VisualizationInputs,
     WeldProcess,
     Zone,
     EnhancedNDEMethod,
 )
+from lr_hatch_coaming.evidence import write_evidence, write_summary_json
 from lr_hatch_coaming.pipeline import run_pipeline
+from lr_hatch_coaming.viz_2d import _composite
 
 
 @pytest.fixture
@@ -197,3 +202,79 @@ class TestE2EPipeline:
         # Run again (simulating add of new measure) — should not decrease
         summary2 = run_pipeline(pi)
         assert summary2["total_applications"] >= count1
+
+
+class TestEvidence:
+
+    def test_snippets_written_verbatim(self, output_dir):
+        rules = RulesExtraction(source_snippets={
+            "LR Pt4 Ch8/p1": "Table 8.2.1\n미지정 — 100% UT\n",
+            "C:notes": "",
+        })
+        decision = DecisionResult(
+            project_meta=ProjectMeta(project_id="EV-001"),
+            control_parameters=ControlParameters(),
+        )
+        paths = write_evidence(output_dir, rules, decision)
+
+        path = paths["snippet_LR_Pt4_Ch8_p1"]
+        assert path.endswith(os.path.join("ocr_snippets", "LR_Pt4_Ch8_p1.txt"))
+        with open(path, "rb") as f:
+            assert f.read().decode("utf-8") == rules.source_snippets["LR Pt4 Ch8/p1"]
+        assert os.path.getsize(paths["snippet_C_notes"]) == 0
+
+    def test_ocr_confidence_keeps_ascii_escaping(self, output_dir):
+        rules = RulesExtraction(ocr_confidence={"LR Pt4 — p1": 0.875})
+        decision = DecisionResult(
+            project_meta=ProjectMeta(project_id="EV-004"),
+            control_parameters=ControlParameters(),
+        )
+        paths = write_evidence(output_dir, rules, decision)
+
+        with open(paths["ocr_confidence"], "rb") as f:
+            raw = f.read()
+        assert raw == json.dumps(rules.ocr_confidence, indent=2).encode("ascii")
+
+    def test_many_snippets_written(self, output_dir):
+        snippets = {f"page {i}": f"text {i}" for i in range(40)}
+        decision = DecisionResult(
+            project_meta=ProjectMeta(project_id="EV-002"),
+            control_parameters=ControlParameters(),
+        )
+        paths = write_evidence(output_dir, RulesExtraction(source_snippets=snippets), decision)
+
+        for i in range(40):
+            with open(paths[f"snippet_page_{i}"], encoding="utf-8") as f:
+                assert f.read() == f"text {i}"
+
+    def test_summary_json_stringifies_unknown_values(self, output_dir):
+        summary = {"project_id": "EV-003", "vessel": "미지정", "bbox": HatchOpeningBbox(L=1, B=2, H=3)}
+        path = write_summary_json(output_dir, summary)
+
+        assert path == os.path.join(output_dir, "pipeline_summary.json")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["vessel"] == "미지정"
+        assert data["bbox"] == str(summary["bbox"])
+
+
+class TestViz2D:
+
+    def test_composite_matches_stacked_layers_over_white(self):
+        layers = [("#2196F3", 0.35), ("#FF9800", 0.30), ("#888", 0.25)]
+        ((color, alpha),) = _composite(layers)
+
+        stacked = [255.0, 255.0, 255.0]
+        for c, a in layers:
+            h = c.lstrip("#")
+            h = "".join(ch * 2 for ch in h) if len(h) == 3 else h
+            rgb = [int(h[i:i + 2], 16) for i in (0, 2, 4)]
+            stacked = [bg * (1 - a) + ch * a for bg, ch in zip(stacked, rgb)]
+        flat = [int(color[i:i + 2], 16) for i in (1, 3, 5)]
+        single = [255 * (1 - alpha) + ch * alpha for ch in flat]
+        assert all(abs(x - y) < 1 for x, y in zip(single, stacked))
+
+    def test_composite_leaves_named_colours_alone(self):
+        layers = [("red", 0.35), ("#FF9800", 0.30)]
+        assert _composite(layers) == layers
+        assert _composite(layers[1:]) == layers[1:]
@@ -0,0 +1,176 @@
+"""Tests for the OCR text parsers.
+
+These run on plain text, so no OCR back-end is needed.
+"""
+
+from __future__ import annotations
+
+import os
+
+from lr_hatch_coaming.models import MeasureStatus, ScannedRuleImage
+from lr_hatch_coaming.ocr_extractor import (
+    _extract_textual_requirements,
+    _parse_table_821_from_text,
+    _parse_table_822_from_text,
+)
+
+
+_TABLE_TEXT = """Table 8.2.1
+355 N/mm2
+t ≤ 50  Not required Not required Not required Not required
+50 < t ≤ 65  Required Not required Not required Not required
+390 N/mm2
+85 < t ≤ 100 Required See Note 2 Required Required
+bogus line t ≤ 40 Required
+Table 8.2.2
+Upper deck
+390 N/mm2 65 < t ≤ 100 BCA 1
+Hatch coaming side
+bca2
+"""
+
+
+class TestTableParsers:
+
+    def test_table_821_rows(self):
+        rows = _parse_table_821_from_text(_TABLE_TEXT)
+        assert [(r.yield_strength_nmm2, r.t_min_mm, r.t_max_mm) for r in rows] == [
+            (355, 0.0, 50.0), (355, 50.0, 65.0), (390, 85.0, 100.0),
+        ]
+        assert rows[0].measure_1.status == MeasureStatus.not_required
+        assert rows[1].measure_1.status == MeasureStatus.required
+        assert rows[1].measure_2.status == MeasureStatus.not_required
+        assert rows[2].measure_2.status == MeasureStatus.see_note_2
+        assert rows[2].measure_2.raw_text == "See Note 2"
+
+    def test_table_822_entries(self):
+        entries = _parse_table_822_from_text(_TABLE_TEXT)
+        assert [(e.member_category, e.yield_strength_nmm2, e.bca_type) for e in entries] == [
+            ("upper_deck", 390, "BCA1"), ("hatch_coaming_side", 0, "BCA2"),
+        ]
+        assert entries[0].t_min_mm == 65.0 and entries[1].t_max_mm == 999.0
+
+
+class TestTextualRequirements:
+
+    def test_keywords_produce_snippets(self):
+        text = (
+            "Measure 1: 100% UT of butt joints. Block shift of 300 mm. "
+            "Enhanced NDE with CTOD 0.18 mm. EGW shall not be used."
+        )
+        reqs = _extract_textual_requirements(text)
+        assert reqs["measure_1_ut_requirement"].startswith("Measure 1: 100% UT")
+        assert "Block shift" in reqs["measure_3_block_shift"]
+        assert {"measure_3_enhanced_nde", "ctod_requirement", "egw_prohibition"} <= set(reqs)
+        assert "pjp_weld_requirement" not in reqs
+
+    def test_empty_text(self):
+        assert _extract_textual_requirements("") == {}
+
+
+class TestExtractRules:
+
+    def test_results_merged_in_input_order(self, tmp_path, monkeypatch):
+        import time
+
+        from lr_hatch_coaming import ocr_extractor
+
+        paths = []
+        for i in range(4):
+            p = tmp_path / f"page{i}.png"
+            p.write_bytes(b"")
+            paths.append(str(p))
+        (tmp_path / "notes.docx").write_bytes(b"")
+
+        def fake_ocr(fpath):
+            i = paths.index(fpath)
+            time.sleep(0.01 * (4 - i))  # later files finish first
+            return ("" if i == 2 else f"text {i}"), 0.5
+
+        monkeypatch.setattr(ocr_extractor, "_ocr_file", fake_ocr)
+        monkeypatch.setattr(ocr_extractor, "_BACKENDS_LOADED", True)
+        monkeypatch.setattr(ocr_extractor, "_HAS_TESSERACT", True)
+        srcs = [ScannedRuleImage(file_path=p, doc_label=f"L{i}") for i, p in enumerate(paths)]
+        srcs.insert(1, ScannedRuleImage(file_path=str(tmp_path / "missing.png"), doc_label="M"))
+        srcs.append(ScannedRuleImage(file_path=str(tmp_path / "notes.docx"), doc_label="D"))
+        result = ocr_extractor.extract_rules(srcs)
+
+        assert list(result.source_snippets) == ["L0", "L1", "L3"]
+        assert result.source_snippets["L3"] == "text 3"
+        prefixes = ("File not found", "OCR returned empty text", "Unsupported file type")
+        for warning, prefix in zip(result.extraction_warnings, prefixes):
+            assert warning.startswith(prefix)
+
+    def test_pdfs_read_on_calling_thread(self, tmp_path, monkeypatch):
+        import threading
+
+        from lr_hatch_coaming import ocr_extractor
+
+        names = ["a.png", "b.pdf", "c.png", "d.PDF", "e.png"]
+        for name in names:
+            (tmp_path / name).write_bytes(b"")
+        threads = {}
+
+        def fake_ocr(fpath):
+            threads[os.path.basename(fpath)] = threading.get_ident()
+            return f"text {os.path.basename(fpath)}", 0.5
+
+        monkeypatch.setattr(ocr_extractor, "_ocr_file", fake_ocr)
+        monkeypatch.setattr(ocr_extractor, "_BACKENDS_LOADED", True)
+        monkeypatch.setattr(ocr_extractor, "_HAS_TESSERACT", True)
+        srcs = [ScannedRuleImage(file_path=str(tmp_path / n), doc_label=n) for n in names]
+        result = ocr_extractor.extract_rules(srcs)
+
+        assert list(result.source_snippets) == names
+        assert result.source_snippets["d.PDF"] == "text d.PDF"
+        assert threads["b.pdf"] == threads["d.PDF"] == threading.get_ident()
+
+    def test_easyocr_images_read_on_calling_thread(self, tmp_path, monkeypatch):
+        import threading
+
+        from lr_hatch_coaming import ocr_extractor
+
+        names = ["a.png", "b.jpg", "c.png"]
+        for name in names:
+            (tmp_path / name).write_bytes(b"")
+        threads = set()
+
+        def fake_ocr(fpath):
+            threads.add(threading.get_ident())
+            return "text", 0.5
+
+        monkeypatch.setattr(ocr_extractor, "_ocr_file", fake_ocr)
+        monkeypatch.setattr(ocr_extractor, "_BACKENDS_LOADED", True)
+        monkeypatch.setattr(ocr_extractor, "_HAS_TESSERACT", False)
+        monkeypatch.setattr(ocr_extractor, "_HAS_EASYOCR", True)
+        srcs = [ScannedRuleImage(file_path=str(tmp_path / n), doc_label=n) for n in names]
+        result = ocr_extractor.extract_rules(srcs)
+
+        assert list(result.source_snippets) == names
+        assert threads == {threading.get_ident()}
+
+    def test_cache_reused_until_file_changes(self, tmp_path, monkeypatch):
+        from lr_hatch_coaming import ocr_extractor
+
+        page = tmp_path / "page.png"
+        page.write_bytes(b"scan")
+        calls = []
+
+        def fake_ocr(fpath):
+            calls.append(fpath)
+            return "Table 8.2.1", 0.9
+
+        monkeypatch.setattr(ocr_extractor, "_ocr_file", fake_ocr)
+        srcs = [ScannedRuleImage(file_path=str(page), doc_label="P")]
+        cache_dir = str(tmp_path / "cache")
+
+        first = ocr_extractor.extract_rules(srcs, cache_dir=cache_dir)
+        second = ocr_extractor.extract_rules(srcs, cache_dir=cache_dir)
+        assert len(calls) == 1
+        assert second.source_snippets == first.source_snippets
+        assert second.ocr_confidence == first.ocr_confidence
+
+        st = os.stat(page)
+        os.utime(page, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        ocr_extractor.extract_rules(srcs, cache_dir=cache_dir)
+        assert len(calls) == 2